@@ -6,9 +6,76 @@ hardcoding secrets is how we end up on Reddit's "bad code" threads.
 
 Loads credentials and settings from environment variables.
 """
+import functools
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+
+
+# Parsed .env contents keyed by environment name (None = default .env)
+# Reading and parsing the file is the slow part, so we only do it once per
+# environment per process and replay the cached values after that
+_ENV_CACHE = {}
+
+
+def _load_env_values(env_name=None):
+    """Read and cache the variables defined in an environment's .env file.
+    
+    Args:
+        env_name (str, optional): Environment name (e.g., 'bidevt', 'wiprt').
+                                 If None, reads the default .env file.
+    
+    Returns:
+        dict: Variable names mapped to their values.
+        
+    Raises:
+        FileNotFoundError: If the named environment file does not exist.
+    """
+    if env_name not in _ENV_CACHE:
+        if env_name:
+            # Get the project root directory (one level up from scripts/)
+            project_root = Path(__file__).parent.parent
+            env_file = project_root / f'.env.{env_name}'
+            if not env_file.exists():
+                raise FileNotFoundError(f"Environment file not found: {env_file}")
+            values = dotenv_values(env_file)
+        else:
+            # Searches upward for a default .env file (empty if there isn't one)
+            values = dotenv_values()
+        # Bare keys with no '=' come back as None - they can't go in os.environ
+        _ENV_CACHE[env_name] = {key: value for key, value in values.items() if value is not None}
+    return _ENV_CACHE[env_name]
+
+
+# Endpoint URL templates, keyed by the attribute name prefix on Config
+# Adding an endpoint is just a new entry here - {tenant} is the tenant URL
+# and {version} is the configured API_VERSION
+_URL_TEMPLATES = {
+    # The fully-qualified base URL for API calls
+    'base': '{tenant}/{version}',
+    # OAuth tokens live at v1.0, because IBM likes to keep us on our toes
+    'token': '{tenant}/v1.0/endpoint/default/token',
+    # The URL for fetching application data
+    'applications': '{tenant}/{version}/applications',
+    # Federations use v1.0 SAML endpoint per IBM Verify API docs
+    'federations': '{tenant}/v1.0/saml/federations',
+    # Use v1.0 authenticators endpoint - returns configured MFA authenticators
+    'mfa': '{tenant}/v1.0/authenticators',
+    # Use v2.0 factors endpoint - returns MFA factor configurations
+    'factors': '{tenant}/v2.0/factors',
+    # Attributes use v1.0 endpoint per IBM Verify API docs
+    'attributes': '{tenant}/v1.0/attributes',
+    # Attribute functions - GET /v1.0/attributefunctions per IBM Verify API docs
+    'attribute_functions': '{tenant}/v1.0/attributefunctions',
+    # Groups use v2.0 endpoint per Groups Management Version 2.0 docs
+    'groups': '{tenant}/v2.0/Groups',
+    # Identity sources use v1.0 endpoint - includes SAML, LDAP, AD connectors
+    'identity_sources': '{tenant}/v1.0/identitysources',
+    # API clients use v1.0 endpoint - OAuth/OIDC client configurations
+    'api_clients': '{tenant}/v1.0/apiclients',
+    # SCIM service provider capabilities (v2.0, SCIM content type)
+    'scim_capabilities': '{tenant}/v2.0/SCIM/capabilities',
+}
 
 
 class Config:
@@ -17,8 +84,34 @@ class Config:
     We centralize all our config here so we're not hunting through
     a dozen files when something needs to change. Future us will
     thank present us for this moment of clarity.
+    
+    Instances are read-only once constructed. get_config hands the same
+    instance to everyone who asks for an environment, so nobody gets to
+    quietly change settings out from under the other callers.
     """
     
+    # Fixed attribute layout - no per-instance __dict__, so instances are
+    # smaller and attribute reads skip the dict lookup. Every attribute set
+    # in __init__ must be listed here (URL attributes come from the templates)
+    __slots__ = (
+        'ENV_NAME',
+        'TENANT_URL',
+        'CLIENT_ID',
+        'CLIENT_SECRET',
+        'API_VERSION',
+        'REQUEST_TIMEOUT',
+        'MAX_RETRIES',
+        'RETRY_BACKOFF',
+        'MAX_WORKERS',
+        'SUPPORTS_INCLUDE',
+        'RESUME_MAX_AGE',
+        'DEFAULT_PAGE_SIZE',
+        'PAGE_SIZES',
+        'OUTPUT_DIR',
+        'TOKEN_CACHE_DIR',
+        '_frozen',
+    ) + tuple(f'{name}_url' for name in _URL_TEMPLATES)
+    
     def __init__(self, env_name=None):
         """Initialize configuration by reading from environment variables.
         
@@ -32,18 +125,18 @@ class Config:
                                      If None, loads from default .env file or existing env vars.
         """
         # Load environment-specific .env file if env_name is provided
+        env_values = _load_env_values(env_name)
         if env_name:
-            # Get the project root directory (one level up from scripts/)
-            project_root = Path(__file__).parent.parent
-            env_file = project_root / f'.env.{env_name}'
-            if env_file.exists():
-                # Override=True ensures we reload even if vars are already set
-                load_dotenv(env_file, override=True)
-            else:
-                raise FileNotFoundError(f"Environment file not found: {env_file}")
+            # Override existing vars so switching environments takes effect
+            os.environ.update(env_values)
         else:
-            # Load from default .env file if it exists
-            load_dotenv()
+            # Default .env only fills in vars that aren't already set
+            for key, value in env_values.items():
+                os.environ.setdefault(key, value)
+        
+        # Remember which environment we loaded - used to key per-environment
+        # caches such as the on-disk token cache
+        self.ENV_NAME = env_name
         
         # Load credentials from environment variables
         self.TENANT_URL = os.getenv('IBM_VERIFY_TENANT_URL', '')
@@ -59,116 +152,74 @@ class Config:
         self.MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
         # Exponential backoff multiplier (patience grows with each retry)
         self.RETRY_BACKOFF = float(os.getenv('RETRY_BACKOFF', '2.0'))
+        # How many requests the detail fetchers keep in flight at once
+        self.MAX_WORKERS = int(os.getenv('MAX_WORKERS', '16'))
+        # Whether the tenant's application endpoint honors
+        # ?include=entitlements,sso - lets us fetch details in one request
+        self.SUPPORTS_INCLUDE = os.getenv('SUPPORTS_INCLUDE', 'false').lower() in ('1', 'true', 'yes')
+        # Seconds a previously fetched application detail record stays good
+        # for - re-runs skip those apps instead of fetching them again.
+        # 0 disables resuming, so every run starts from scratch
+        self.RESUME_MAX_AGE = int(os.getenv('RESUME_MAX_AGE', '0'))
         
         # Pagination - fetching data in reasonable chunks
         # Default page size for paginated API requests
-        self.DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', '100'))
+        self.DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', '200'))
+        # Per-endpoint overrides, e.g. ATTRIBUTES_PAGE_SIZE=1000 - endpoints
+        # that accept bigger pages need fewer round-trips. Only the ones
+        # actually set are kept; everything else uses DEFAULT_PAGE_SIZE
+        self.PAGE_SIZES = {
+            name: int(os.environ[f'{name.upper()}_PAGE_SIZE'])
+            for name in _URL_TEMPLATES
+            if os.environ.get(f'{name.upper()}_PAGE_SIZE')
+        }
         
         # Output settings - where we stash the goods
         # Directory path for storing fetched data files
         self.OUTPUT_DIR = os.getenv('OUTPUT_DIR', 'data')
-    
-    # API Endpoints - we use properties for dynamic URL construction
-    @property
-    def base_url(self):
-        """Get the base API URL.
+        # Where OAuth tokens are cached between runs (set empty to disable)
+        self.TOKEN_CACHE_DIR = os.getenv(
+            'TOKEN_CACHE_DIR', str(Path.home() / '.cache' / 'iam_vision')
+        )
         
-        Returns:
-            str: The fully-qualified base URL for API calls.
-        """
-        # Construct our base URL from tenant and version
-        return f"{self.TENANT_URL}/{self.API_VERSION}"
-    
-    @property
-    def token_url(self):
-        """Get the OAuth token endpoint.
-        
-        Returns:
-            str: The URL where we beg for access tokens.
-        """
-        # OAuth tokens live at v1.0, because IBM likes to keep us on our toes
-        return f"{self.TENANT_URL}/v1.0/endpoint/default/token"
-    
-    @property
-    def applications_url(self):
-        """Get the applications endpoint.
-        
-        Returns:
-            str: The URL for fetching application data.
-        """
-        # Build the applications endpoint URL
-        return f"{self.base_url}/applications"
-    
-    @property
-    def federations_url(self):
-        """Get the federations endpoint.
+        # API Endpoints - built once here rather than on every access, since
+        # the detail fetchers look these up inside per-record loops.
+        # Each template becomes an attribute, e.g. 'applications' -> applications_url
+        url_context = {'tenant': self.TENANT_URL, 'version': self.API_VERSION}
+        for name, template in _URL_TEMPLATES.items():
+            setattr(self, f'{name}_url', template.format_map(url_context))
         
-        Returns:
-            str: The URL for federation configurations.
-        """
-        # Federations use v1.0 SAML endpoint per IBM Verify API docs
-        return f"{self.TENANT_URL}/v1.0/saml/federations"
-    
-    @property
-    def mfa_url(self):
-        """Get the MFA configurations endpoint.
-        
-        Returns:
-            str: The URL for MFA authenticators configurations.
-        """
-        # Use v1.0 authenticators endpoint - returns configured MFA authenticators
-        return f"{self.TENANT_URL}/v1.0/authenticators"
-    
-    @property
-    def factors_url(self):
-        """Get the MFA factors endpoint.
+        # Fail fast - a missing credential should stop us here, not after
+        # a wasted round-trip to the token endpoint
+        self.validate()
         
-        Returns:
-            str: The URL for MFA factors (v2.0 endpoint).
-        """
-        # Use v2.0 factors endpoint - returns MFA factor configurations
-        return f"{self.TENANT_URL}/v2.0/factors"
+        # Everything's loaded - lock the instance against further changes
+        self._frozen = True
     
-    @property
-    def attributes_url(self):
-        """Get the attributes endpoint.
+    def __setattr__(self, name, value):
+        """Block attribute assignment once the instance is fully built.
         
-        Returns:
-            str: The URL for user attribute schemas.
+        Raises:
+            AttributeError: If the configuration has already been frozen.
         """
-        # Attributes use v1.0 endpoint per IBM Verify API docs
-        return f"{self.TENANT_URL}/v1.0/attributes"
+        # getattr default covers the unset slot during __init__
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"Config is read-only; cannot set {name}")
+        object.__setattr__(self, name, value)
     
-    @property
-    def groups_url(self):
-        """Get the groups endpoint.
-        
-        Returns:
-            str: The URL for group data.
-        """
-        # Groups use v2.0 endpoint per Groups Management Version 2.0 docs
-        return f"{self.TENANT_URL}/v2.0/Groups"
     
-    @property
-    def identity_sources_url(self):
-        """Get the identity sources endpoint.
+    def page_size(self, endpoint):
+        """Page size to request from a paginated endpoint.
         
-        Returns:
-            str: The URL for identity source configurations.
-        """
-        # Identity sources use v1.0 endpoint - includes SAML, LDAP, AD connectors
-        return f"{self.TENANT_URL}/v1.0/identitysources"
-    
-    @property
-    def api_clients_url(self):
-        """Get the API clients endpoint.
+        Args:
+            endpoint (str): Endpoint name as used in the URL attributes,
+                           e.g. 'attributes' for attributes_url.
         
         Returns:
-            str: The URL for API client configurations.
+            int: The endpoint's <ENDPOINT>_PAGE_SIZE override if set,
+                otherwise DEFAULT_PAGE_SIZE.
         """
-        # API clients use v1.0 endpoint - OAuth/OIDC client configurations
-        return f"{self.TENANT_URL}/v1.0/apiclients"
-    
+        return self.PAGE_SIZES.get(endpoint, self.DEFAULT_PAGE_SIZE)
     
     def validate(self):
         """Validate that all required configuration is present.
@@ -180,24 +231,33 @@ class Config:
             bool: True if validation passes.
             
         Raises:
-            ValueError: If any required configuration is missing.
+            ValueError: If any required configuration is missing. The message
+                        lists every missing variable, not just the first.
         """
-        # Check each required field and complain loudly if missing
+        # Check each required field and collect everything that's missing,
+        # so one run tells the user all the variables they need to set
+        missing = []
         if not self.TENANT_URL:
             # No tenant URL? Can't do much without knowing where to connect
-            raise ValueError("IBM_VERIFY_TENANT_URL is required")
+            missing.append('IBM_VERIFY_TENANT_URL')
         if not self.CLIENT_ID:
             # Client ID is our identity - we need it
-            raise ValueError("IBM_VERIFY_CLIENT_ID is required")
+            missing.append('IBM_VERIFY_CLIENT_ID')
         if not self.CLIENT_SECRET:
             # The secret sauce - literally cannot authenticate without it
-            raise ValueError("IBM_VERIFY_CLIENT_SECRET is required")
+            missing.append('IBM_VERIFY_CLIENT_SECRET')
+        if missing:
+            # Complain loudly about the whole lot at once
+            verb = "is" if len(missing) == 1 else "are"
+            raise ValueError(f"{', '.join(missing)} {verb} required")
         # All checks passed - we're good to go
         return True
 
 
 # Helper function to create a config instance for a specific environment
 # Use this instead of the old global singleton pattern
+# Cached so repeated calls for the same environment share one instance
+@functools.lru_cache(maxsize=None)
 def get_config(env_name=None):
     """Get a Config instance for the specified environment.
     
@@ -206,6 +266,7 @@ def get_config(env_name=None):
                                  If None, uses default .env or existing env vars.
     
     Returns:
-        Config: Configured instance ready to use.
+        Config: Configured instance ready to use. Repeated calls with the
+            same env_name return the same instance.
     """
     return Config(env_name)
@@ -0,0 +1,121 @@
+"""Run every fetch script against one environment in a single process.
+
+Each fetch_*.py script works fine on its own, but running them one after
+another means each waits for the last to finish - and each pays for its
+own token request and TLS handshakes. Here they share one authenticated
+client (get_client hands the same instance to every script for an
+environment) and run side by side, since they hit different endpoints
+and don't get in each other's way. The one ordering that matters:
+application details are read from fetch_applications' output, so those
+two run back to back.
+
+Outputs the same data/*.jsonl files as the individual scripts.
+"""
+# Standard library imports
+import argparse
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Local imports - every fetcher, plus the shared client and config
+import fetch_api_clients
+import fetch_application_details
+import fetch_applications
+import fetch_attribute_functions
+import fetch_attributes
+import fetch_federations
+import fetch_groups
+import fetch_identity_sources
+import fetch_mfa_config
+import fetch_scim_capabilities
+from fetch_applications import get_client
+from config import get_config
+
+# Configure logging - with everything running at once, the logger name in
+# each line is how you tell the fetchers apart
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+# Logger instance for this module
+logger = logging.getLogger(__name__)
+
+# The fetchers to run, by name. Each entry is a sequence of main functions
+# run in order on one thread - details need applications.jsonl, so they
+# share a slot. Separate entries run concurrently
+FETCHERS = {
+    'applications': (fetch_applications.main, fetch_application_details.main),
+    'attributes': (fetch_attributes.main,),
+    'attribute_functions': (fetch_attribute_functions.main,),
+    'federations': (fetch_federations.main,),
+    'groups': (fetch_groups.main,),
+    'identity_sources': (fetch_identity_sources.main,),
+    'api_clients': (fetch_api_clients.main,),
+    'mfa': (fetch_mfa_config.main,),
+    'scim_capabilities': (fetch_scim_capabilities.main,),
+}
+
+
+def _run_in_order(mains, config):
+    """Run a sequence of fetch scripts' main functions one after another.
+
+    Args:
+        mains (tuple): main functions, each taking a Config.
+        config (Config): Configuration instance to pass to each.
+    """
+    for main_function in mains:
+        main_function(config)
+
+
+def main(config):
+    """Run all fetchers concurrently against one environment.
+
+    A fetcher that fails doesn't stop the others - we collect the failures
+    and report them once everything has finished.
+
+    Args:
+        config (Config): Configuration instance with credentials loaded.
+
+    Returns:
+        list: Names of the fetchers that failed (empty if all succeeded).
+    """
+    # Authenticate once up front, so the fetchers all start with a valid
+    # token instead of racing to request one
+    logger.info("Pre-authenticating client...")
+    get_client(config)._get_access_token()
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(FETCHERS)) as executor:
+        futures = {
+            name: executor.submit(_run_in_order, mains, config)
+            for name, mains in FETCHERS.items()
+        }
+        # Wait for each in turn - the slowest one sets the total run time
+        for name, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                # The fetcher has usually logged the details already
+                logger.error("%s failed: %s", name, e)
+                failed.append(name)
+
+    if failed:
+        logger.error("%d of %d fetchers failed: %s", len(failed), len(FETCHERS), ', '.join(failed))
+    else:
+        logger.info("All %d fetchers finished", len(FETCHERS))
+    return failed
+
+
+# Standard Python entry point pattern
+if __name__ == '__main__':
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description='Fetch all data from IBM Security Verify')
+    parser.add_argument('--env', type=str, help='Environment name (e.g., bidevt, wiprt)')
+    args = parser.parse_args()
+
+    # Load config for the specified environment
+    config = get_config(args.env)
+
+    # Let the caller know if anything went wrong
+    if main(config):
+        sys.exit(1)
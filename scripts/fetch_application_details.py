@@ -9,14 +9,18 @@ Reads application IDs from applications.jsonl and outputs to data/application_de
 """
 # Standard library imports
 import argparse
-import json
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone
-from pathlib import Path
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+
+# Third-party imports - orjson parses and serializes several times faster
+# than the stdlib json module
+import orjson
 
 # Local imports - reusing our client from the applications script
-from fetch_applications import IBMVerifyClient
+from fetch_applications import NOT_MODIFIED, get_client
 from config import get_config
 
 # Configure logging - keeping track of our progress
@@ -29,66 +33,313 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def fetch_application_details(client, app_id):
+def fetch_application_details(client, app_id, fetch_timestamp, executor=None, previous=None):
     """Fetch detailed information for a specific application.
     
     We fetch the base application details plus supplementary info like
-    entitlements and SSO configuration. If supplementary requests fail,
-    we log a warning but keep going - partial data beats no data.
+    entitlements and SSO configuration. When the tenant supports field
+    expansion (SUPPORTS_INCLUDE), all of it comes back from a single
+    request; otherwise we make three requests side by side. If a
+    supplementary one fails, we log a warning but keep going - partial
+    data beats no data.
     
     Args:
         client (IBMVerifyClient): Authenticated API client instance.
         app_id (str): The unique application identifier.
+        fetch_timestamp (str): ISO 8601 timestamp for this fetch run.
+        executor (ThreadPoolExecutor, optional): Pool to run the supplementary
+            requests on. Must not be the pool running this function, or
+            workers could deadlock waiting on each other. If None, a
+            short-lived 2-worker pool is created when needed.
+        previous (dict, optional): This app's 'data' from an earlier run.
+            When given, requests we have an ETag for are made conditional
+            and unchanged parts are reused from here.
         
     Returns:
         dict: Detailed application data with metadata, or None if fetch fails.
     """
     try:
         # Build URL for this specific application
-        url = f"{config.applications_url}/{app_id}"
-        # Fetch the main application details
-        data = client._make_request(url)
-        
-        # Fetch additional details like entitlements (who can use this app)
-        entitlements_url = f"{url}/entitlements"
-        try:
-            # Try to get entitlements data
-            entitlements = client._make_request(entitlements_url)
-            # Extract entitlements array and add to main data
-            data['entitlements'] = entitlements.get('entitlements', [])
-        except Exception as e:
-            # Entitlements fetch failed - log warning and continue
-            logger.warning(f"Could not fetch entitlements for app {app_id}: {e}")
-            # Set empty array so downstream code doesn't break
-            data['entitlements'] = []
-        
-        # Fetch SSO configuration (single sign-on settings)
-        sso_url = f"{url}/sso"
-        try:
-            # Attempt to retrieve SSO config
-            sso_config = client._make_request(sso_url)
-            # Add SSO configuration to our data
-            data['sso_configuration'] = sso_config
-        except Exception as e:
-            # SSO config fetch failed - log it and move on
-            logger.warning(f"Could not fetch SSO config for app {app_id}: {e}")
-            # Empty dict as fallback
-            data['sso_configuration'] = {}
+        url = f"{client.config.applications_url}/{app_id}"
+        
+        if client.config.SUPPORTS_INCLUDE:
+            # One round-trip: ask the server to embed the extras for us
+            data = client._make_request(url, {'include': 'entitlements,sso'})
+            # Normalize to the same shape the split requests produce
+            data.setdefault('entitlements', [])
+            data['sso_configuration'] = data.pop('sso', {})
+        else:
+            data = _fetch_with_sub_requests(client, app_id, url, executor, previous)
         
         # Package everything up with metadata
         return {
-            'fetch_timestamp': datetime.now(timezone.utc).isoformat(),  # When we got it
+            'fetch_timestamp': fetch_timestamp,  # When we got it
             'application_id': app_id,  # Which app this is
             'data': data  # All the juicy details
         }
         
     except Exception as e:
         # Main fetch failed - this is more serious
-        logger.error(f"Error fetching details for application {app_id}: {e}")
+        logger.error("Error fetching details for application %s: %s", app_id, e)
         # Return None to indicate failure
         return None
 
 
+def _fetch_with_sub_requests(client, app_id, url, executor=None, previous=None):
+    """Fetch an application plus its entitlements and SSO config separately.
+    
+    Args:
+        client (IBMVerifyClient): Authenticated API client instance.
+        app_id (str): The unique application identifier (for log messages).
+        url (str): The application's detail URL.
+        executor (ThreadPoolExecutor, optional): Pool for the supplementary
+            requests - see fetch_application_details.
+        previous (dict, optional): This app's data from an earlier run, for
+            conditional requests - see fetch_application_details.
+        
+    Returns:
+        dict: Application data with 'entitlements' and 'sso_configuration' added.
+        
+    Raises:
+        requests.exceptions.RequestException: If the main application fetch fails.
+    """
+    if executor is None:
+        # No shared pool provided - spin up a private one just for this app
+        with ThreadPoolExecutor(max_workers=2) as local_executor:
+            return _fetch_with_sub_requests(client, app_id, url, local_executor, previous)
+    
+    # Split an earlier run's record back into the three responses it was
+    # built from, so each one can be revalidated on its own
+    cached_app = cached_entitlements = cached_sso = None
+    if previous is not None:
+        cached_app = {
+            key: value for key, value in previous.items()
+            if key not in ('entitlements', 'sso_configuration')
+        }
+        cached_entitlements = {'entitlements': previous.get('entitlements', [])}
+        cached_sso = previous.get('sso_configuration')
+    
+    # Fire off both supplementary requests first: entitlements (who can
+    # use this app) and SSO configuration (single sign-on settings).
+    # They're in flight while we fetch the main details below, so the
+    # whole app costs roughly one round-trip instead of three
+    entitlements_future = executor.submit(
+        _get_or_reuse, client, f"{url}/entitlements", cached_entitlements
+    )
+    sso_future = executor.submit(_get_or_reuse, client, f"{url}/sso", cached_sso)
+    
+    try:
+        # Fetch the main application details
+        data = _get_or_reuse(client, url, cached_app)
+    except Exception:
+        # No point waiting on the extras if the app itself failed
+        entitlements_future.cancel()
+        sso_future.cancel()
+        raise
+    
+    try:
+        # Extract entitlements array and add to main data
+        data['entitlements'] = entitlements_future.result().get('entitlements', [])
+    except Exception as e:
+        # Entitlements fetch failed - log warning and continue
+        logger.warning("Could not fetch entitlements for app %s: %s", app_id, e)
+        # Set empty array so downstream code doesn't break
+        data['entitlements'] = []
+        # The placeholder doesn't match any ETag we hold - don't let a
+        # later run revalidate against it
+        client.etags.pop(f"{url}/entitlements", None)
+    
+    try:
+        # Add SSO configuration to our data
+        data['sso_configuration'] = sso_future.result()
+    except Exception as e:
+        # SSO config fetch failed - log it and move on
+        logger.warning("Could not fetch SSO config for app %s: %s", app_id, e)
+        # Empty dict as fallback
+        data['sso_configuration'] = {}
+        client.etags.pop(f"{url}/sso", None)
+    
+    return data
+
+
+def _get_or_reuse(client, url, cached=None):
+    """GET a resource, reusing an earlier copy if the server says it's unchanged.
+    
+    Args:
+        client (IBMVerifyClient): Authenticated API client instance.
+        url (str): The resource URL.
+        cached (dict, optional): What this URL returned on an earlier run.
+            Without it (or without a stored ETag) this is a plain GET.
+        
+    Returns:
+        dict: The current response body.
+    """
+    etag = client.etags.get(url) if cached is not None else None
+    # ETags are only worth keeping if a resumed run will read them back
+    result = client._make_request(
+        url, etag=etag, record_etag=client.config.RESUME_MAX_AGE > 0
+    )
+    return cached if result is NOT_MODIFIED else result
+
+
+def _application_etags(etags, applications_url, app_ids):
+    """Pick out the ETags that belong to application detail requests.
+    
+    The client is shared with other fetchers under fetch_all.py, so its
+    etags dict isn't ours alone - keep only the URLs this script requests,
+    and only for applications that are still listed, so the file doesn't
+    keep growing with apps deleted long ago.
+    
+    Args:
+        etags (dict): The client's ETags, keyed by URL.
+        applications_url (str): Base URL of the applications endpoint.
+        app_ids (set): IDs of the applications in this run's input.
+        
+    Returns:
+        dict: ETags for {applications_url}/{id}, plus its /entitlements
+            and /sso sub-resources.
+    """
+    prefix = f"{applications_url}/"
+    kept = {}
+    for url, etag in etags.items():
+        if not url.startswith(prefix):
+            continue
+        app_id, _, sub_resource = url[len(prefix):].partition('/')
+        if app_id in app_ids and sub_resource in ('', 'entitlements', 'sso'):
+            kept[url] = etag
+    return kept
+
+
+def load_etags(etags_file):
+    """Load the ETags saved by a previous resumed run.
+    
+    They only save requests, so a missing, unreadable or malformed file
+    just means starting without any.
+    
+    Args:
+        etags_file (str): Path to application_details.etags.json.
+        
+    Returns:
+        dict: ETags keyed by URL (empty if there's nothing usable).
+    """
+    try:
+        with open(etags_file, 'rb') as f:
+            etags = orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable ETag file %s: %s", etags_file, e)
+        return {}
+    if not isinstance(etags, dict):
+        logger.warning("Ignoring malformed ETag file %s", etags_file)
+        return {}
+    return etags
+
+
+def save_etags(etags_file, etags):
+    """Save ETags for the next resumed run.
+    
+    Written to a temp file and swapped in, so a run interrupted mid-write
+    leaves the previous file rather than a truncated one.
+    
+    Args:
+        etags_file (str): Path to application_details.etags.json.
+        etags (dict): ETags keyed by URL. If empty, any old file is removed.
+    """
+    if not etags:
+        if os.path.isfile(etags_file):
+            os.remove(etags_file)
+        return
+    tmp_file = f"{etags_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(etags))
+    os.replace(tmp_file, etags_file)
+
+
+def iter_application_ids(applications_file, ids_file):
+    """Yield application IDs recorded by fetch_applications.py.
+    
+    We prefer the slim ID index when it was written with (or after) the
+    current applications file, since it skips JSON parsing entirely.
+    Otherwise we parse the JSONL. Either way IDs are streamed one at a
+    time rather than collected into a list.
+    
+    Args:
+        applications_file (str): Path to the applications.jsonl file.
+        ids_file (str): Path to the applications.ids.txt index next to it.
+        
+    Yields:
+        str: Application IDs in file order.
+    """
+    # Plain os.stat on the str paths - one syscall per file instead of
+    # exists() followed by stat(), and no intermediate Path objects
+    try:
+        index_is_fresh = os.stat(ids_file).st_mtime >= os.stat(applications_file).st_mtime
+    except FileNotFoundError:
+        index_is_fresh = False
+    
+    if index_is_fresh:
+        with open(ids_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                app_id = line.rstrip('\n')
+                if app_id:
+                    yield app_id
+        return
+    
+    # No usable index (e.g. older data) - fall back to parsing the JSONL
+    # Binary mode - orjson parses the raw UTF-8 bytes without a decode step
+    with open(applications_file, 'rb') as f:
+        # Process each line (each is a complete JSON object)
+        for line in f:
+            # Parse JSON from this line
+            app_data = orjson.loads(line)
+            # Extract application ID from nested structure
+            app_id = app_data.get('data', {}).get('id')
+            # Only yield if we actually found an ID
+            if app_id:
+                yield app_id
+
+
+def load_previous_details(output_file, max_age):
+    """Sort a previous run's records into ones to keep and ones to refresh.
+    
+    This is what lets an interrupted or partially failed run pick up where
+    it left off. Records younger than max_age are kept as-is. Older ones
+    are returned parsed so their applications can be revalidated with
+    conditional requests. Lines that don't parse (e.g. a half-written
+    final line from a run that was killed mid-write) are dropped.
+    
+    Args:
+        output_file (str): Path to an existing application_details.jsonl.
+        max_age (int): Maximum record age in seconds.
+        
+    Returns:
+        tuple: (dict of application IDs already fetched mapped to their raw
+            JSON lines, to carry over into the new output file, dict of
+            stale application IDs mapped to their old 'data').
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+    fresh_lines = {}
+    stale_data = {}
+    with open(output_file, 'rb') as f:
+        for line in f:
+            try:
+                record = orjson.loads(line)
+                app_id = record['application_id']
+                fetched_at = datetime.fromisoformat(record['fetch_timestamp'])
+            except (ValueError, KeyError, TypeError):
+                # Not a complete record - we'll just fetch this one again
+                continue
+            if app_id in fresh_lines:
+                continue
+            if fetched_at >= cutoff:
+                # A truncated file may be missing its final newline
+                fresh_lines[app_id] = line if line.endswith(b'\n') else line + b'\n'
+            else:
+                stale_data[app_id] = record.get('data')
+    return fresh_lines, stale_data
+
+
 def main(config):
     """Main function to fetch application details and save to JSONL.
     
@@ -101,49 +352,85 @@ def main(config):
         config (Config): Configuration instance with credentials loaded.
     """
     try:
-        # Validate configuration first (fail fast if something's wrong)
-        config.validate()
-        
-        # Set up file paths using pathlib (works on Windows and Unix)
-        output_dir = Path(config.OUTPUT_DIR)
+        # Resolve file paths once as plain strings with os.path (works on
+        # Windows and Unix) - they go straight to open()/os.stat()
+        output_dir = config.OUTPUT_DIR
         # Input file with application IDs
-        applications_file = output_dir / 'applications.jsonl'
+        applications_file = os.path.join(output_dir, 'applications.jsonl')
+        # ID index written alongside it by fetch_applications.py
+        ids_file = os.path.join(output_dir, 'applications.ids.txt')
         # Output file for detailed application data
-        output_file = output_dir / 'application_details.jsonl'
+        output_file = os.path.join(output_dir, 'application_details.jsonl')
+        # ETags from the last run, for conditional requests when resuming
+        etags_file = os.path.join(output_dir, 'application_details.etags.json')
+        # IDs of applications whose details couldn't be fetched this run
+        failed_file = os.path.join(output_dir, 'application_details.failed.txt')
         
         # Check if input file exists before proceeding
-        if not applications_file.exists():
+        if not os.path.isfile(applications_file):
             # Can't fetch details without IDs - bail out with helpful error
             logger.error(f"Applications file not found: {applications_file}")
             logger.error("Please run fetch_applications.py first")
             return
         
         # Initialize our API client (handles authentication)
-        client = IBMVerifyClient(config)
-        
-        # Read application IDs from the input file
-        # We create a list to hold all the IDs we find
-        app_ids = []
-        # Open input file and parse JSONL format
-        with open(applications_file, 'r', encoding='utf-8') as f:
-            # Process each line (each is a complete JSON object)
-            for line in f:
-                # Parse JSON from this line
-                app_data = json.loads(line)
-                # Extract application ID from nested structure
-                app_id = app_data.get('data', {}).get('id')
-                # Only add if we actually found an ID
-                if app_id:
-                    app_ids.append(app_id)
+        client = get_client(config)
+        
+        # Stream application IDs from disk - workers start on the first IDs
+        # while the rest of the file is still being read
+        app_ids = iter_application_ids(applications_file, ids_file)
         
-        # Log how many apps we'll be processing
-        logger.info(f"Found {len(app_ids)} applications to fetch details for")
+        # When resuming, carry over recent records from the last run and
+        # skip their applications rather than fetching them all again
+        fresh_lines = {}
+        # Older records - revalidated with If-None-Match rather than
+        # downloaded again, when we have their ETags
+        stale_data = {}
+        # Fresh records whose application is still in the current list -
+        # only these make it into the new output. Anything left behind in
+        # fresh_lines belongs to an application deleted on the tenant
+        kept_lines = []
+        # Every ID in this run's input, so saved ETags can be pruned to
+        # the applications that still exist
+        listed_ids = set()
+        if config.RESUME_MAX_AGE > 0:
+            if os.path.isfile(output_file):
+                fresh_lines, stale_data = load_previous_details(
+                    output_file, config.RESUME_MAX_AGE
+                )
+                logger.info("Resuming: %d applications already fetched", len(fresh_lines))
+            client.etags.update(load_etags(etags_file))
+            
+            def skip_fresh(ids):
+                # Keep the old record for each current app that has one,
+                # and pass the rest through to be fetched
+                for app_id in ids:
+                    listed_ids.add(app_id)
+                    line = fresh_lines.pop(app_id, None)
+                    if line is None:
+                        yield app_id
+                    else:
+                        kept_lines.append(line)
+            
+            app_ids = skip_fresh(app_ids)
         
-        # If no applications to process, exit early
-        if len(app_ids) == 0:
+        # Peek at the first ID so we can exit early if there's nothing to do
+        first_app_id = next(app_ids, None)
+        if first_app_id is None:
+            # Every current app already has a fresh record. Rewrite the
+            # output anyway if some records belong to deleted apps
+            if fresh_lines:
+                with open(output_file, 'wb') as f:
+                    f.writelines(kept_lines)
+            if config.RESUME_MAX_AGE > 0:
+                save_etags(etags_file, _application_etags(
+                    client.etags, config.applications_url, listed_ids
+                ))
             logger.info("No applications to fetch details for - exiting")
             logger.info(f"Details saved to {output_file}")
             return
+        # Put the peeked ID back in front of the stream
+        app_ids = itertools.chain([first_app_id], app_ids)
         
         # Pre-authenticate the client before starting parallel workers
         # This prevents multiple threads from trying to get tokens simultaneously
@@ -153,44 +440,132 @@ def main(config):
         
         # Fetch and write application details in parallel
         # We use ThreadPoolExecutor because the work is I/O-bound (waiting on API calls)
-        # Track how many succeeded (some might fail)
+        # Track how many we've handled and how many succeeded (some might fail)
+        processed = 0
         successful = 0
-        # Use up to 10 concurrent workers (API rate limiting consideration)
-        max_workers = 10
-        
-        logger.info(f"Fetching details for {len(app_ids)} applications using {max_workers} parallel workers")
-        
-        # Open output file in write mode
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Create a thread pool for parallel execution
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all fetch tasks to the executor
-                # We create a dict to track which future corresponds to which app_id
-                future_to_app_id = {
-                    executor.submit(fetch_application_details, client, app_id): app_id
-                    for app_id in app_ids
-                }
+        # Which applications failed, so they can be looked at (or retried)
+        # without diffing the input against the output
+        failed_ids = []
+        # Concurrent workers - tune via MAX_WORKERS to stay under the API rate limit
+        max_workers = config.MAX_WORKERS
+        
+        logger.info(f"Fetching application details using {max_workers} parallel workers")
+        
+        # Stamp every record with the run's start time - computed once here
+        # instead of reading the clock in each worker
+        fetch_timestamp = datetime.now(timezone.utc).isoformat()
+        
+        # Serialized lines waiting to be written - flushed in batches so we
+        # make one write call per batch rather than one per application
+        pending_lines = []
+        # How many lines to collect before flushing to disk
+        write_batch_size = 500
+        # The batch currently being written in the background (if any)
+        write_future = None
+        
+        # Open output file in binary write mode (orjson emits bytes) with a
+        # 1 MiB buffer so batches coalesce into few write syscalls
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            # Create a thread pool for parallel execution, plus a separate pool
+            # for each app's entitlements/SSO sub-requests (two per app worker).
+            # Keeping them apart means app workers never block waiting on
+            # sub-requests queued behind themselves. A single writer thread
+            # does the disk writes in order, so a slow disk doesn't hold up
+            # collecting finished fetches and handing out new ones
+            with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                    ThreadPoolExecutor(max_workers=max_workers * 2) as sub_executor, \
+                    ThreadPoolExecutor(max_workers=1) as writer:
+                def submit(app_id):
+                    # Start fetching one app and remember which future is which
+                    future = executor.submit(
+                        fetch_application_details, client, app_id, fetch_timestamp,
+                        sub_executor, stale_data.pop(app_id, None)
+                    )
+                    in_flight[future] = app_id
+                
+                # Futures currently running or queued, mapped to their app_id.
+                # We keep at most two per worker in flight and submit a new
+                # one each time one finishes, so memory stays flat no matter
+                # how many applications the tenant has
+                in_flight = {}
+                for app_id in itertools.islice(app_ids, max_workers * 2):
+                    submit(app_id)
                 
                 # Process results as they complete (not in submission order)
-                for i, future in enumerate(as_completed(future_to_app_id), 1):
-                    app_id = future_to_app_id[future]
-                    try:
-                        # Get the result from this completed future
-                        details = future.result()
-                        # Check if fetch succeeded
-                        if details:
-                            # Write this application's details as a JSON line
-                            f.write(json.dumps(details) + '\n')
-                            # Increment success counter
-                            successful += 1
-                        # Log progress every 10 apps or at the end
-                        if i % 10 == 0 or i == len(app_ids):
-                            logger.info(f"Progress: {i}/{len(app_ids)} applications processed ({successful} successful)")
-                    except Exception as e:
-                        logger.error(f"Error processing application {app_id}: {e}")
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        app_id = in_flight.pop(future)
+                        processed += 1
+                        # Refill the slot this one just freed up
+                        next_app_id = next(app_ids, None)
+                        if next_app_id is not None:
+                            submit(next_app_id)
+                        try:
+                            # Get the result from this completed future
+                            details = future.result()
+                            # Check if fetch succeeded
+                            if details:
+                                # Queue this application's details as a JSON line
+                                # (orjson appends the newline itself)
+                                pending_lines.append(
+                                    orjson.dumps(details, option=orjson.OPT_APPEND_NEWLINE)
+                                )
+                                # Increment success counter
+                                successful += 1
+                            else:
+                                failed_ids.append(app_id)
+                            # Log progress every 50 apps - lazy %-style args so
+                            # nothing is formatted if INFO is switched off
+                            if processed % 50 == 0:
+                                logger.info(
+                                    "Progress: %d applications processed (%d successful)",
+                                    processed, successful
+                                )
+                        except Exception as e:
+                            logger.error("Error processing application %s: %s", app_id, e)
+                            failed_ids.append(app_id)
+                        
+                        # Hand the batch to the writer once it's full
+                        if len(pending_lines) >= write_batch_size:
+                            # Let the previous batch finish first - that raises
+                            # any write error here and caps memory at two batches
+                            if write_future is not None:
+                                write_future.result()
+                            write_future = writer.submit(f.writelines, pending_lines)
+                            pending_lines = []
+            
+            # Surface any error from the last background write
+            if write_future is not None:
+                write_future.result()
+            # Write whatever is left over from the final partial batch
+            f.writelines(pending_lines)
+            # Then the records kept from a previous run - the ID stream has
+            # been read to the end by now, so this list is complete
+            f.writelines(kept_lines)
+        
+        # Records for applications no longer on the tenant are dropped
+        if fresh_lines:
+            logger.info("Dropped %d records for applications that no longer exist", len(fresh_lines))
+        
+        # Save ETags for the next resumed run (only if the API sends them).
+        # Nothing reads them back unless resuming, so don't bother otherwise
+        if config.RESUME_MAX_AGE > 0:
+            save_etags(etags_file, _application_etags(
+                client.etags, config.applications_url, listed_ids
+            ))
+        
+        # Record this run's failures, one ID per line like applications.ids.txt.
+        # A clean run removes the list left behind by an earlier one
+        if failed_ids:
+            with open(failed_file, 'w', encoding='utf-8') as f:
+                f.writelines(f"{app_id}\n" for app_id in failed_ids)
+            logger.warning("%d applications failed - IDs saved to %s", len(failed_ids), failed_file)
+        elif os.path.isfile(failed_file):
+            os.remove(failed_file)
         
         # Log final statistics
-        logger.info(f"Successfully fetched details for {successful}/{len(app_ids)} applications")
+        logger.info(f"Successfully fetched details for {successful}/{processed} applications")
         logger.info(f"Details saved to {output_file}")
         
     except Exception as e:
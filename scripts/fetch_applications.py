@@ -9,29 +9,57 @@ because newline-delimited JSON is our jam for streaming data).
 """
 # Standard library imports - the ones that come with Python
 import argparse
-import json
+import collections
+import contextlib
+import functools
+import itertools
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    # POSIX-only - used to stop parallel script runs from all hitting the
+    # token endpoint at once. Without it (Windows) each run just refreshes
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Third-party imports - the fancy stuff we pip installed
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 
 # Local imports - our own masterpieces
 from config import get_config
 
 # Configure logging - we're setting up our breadcrumb trail
-# DEBUG level for troubleshooting credentials
+# INFO by default; set LOG_LEVEL=DEBUG in the shell environment when
+# troubleshooting credentials or responses. Every other script imports
+# this module first, so this is the level they all end up using
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 # Create our logger instance - this is how we shout into the void
 logger = logging.getLogger(__name__)
 
+# Returned by IBMVerifyClient._make_request when a conditional GET comes
+# back 304 - the caller's previously fetched copy is still current
+NOT_MODIFIED = object()
+
+# HTTP codes worth retrying on data requests: rate limiting and transient
+# server errors. Frozensets because urllib3 checks membership on every
+# response, and nothing should be able to change them
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Token requests only retry transient server errors - see _create_auth_session
+AUTH_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
 
 class IBMVerifyClient:
     """Client for IBM Security Verify API with OAuth2 authentication.
@@ -57,8 +85,19 @@ class IBMVerifyClient:
         self.access_token = None
         # Track when our token expires (Unix timestamp)
         self.token_expires_at = 0
+        # When to start renewing the token early, while it still works
+        self._token_refresh_at = 0
+        # Guards token refresh so parallel workers don't all re-authenticate
+        # at once when the token expires mid-run
+        self._token_lock = threading.Lock()
+        # ETag of the last response seen for each URL whose caller asked
+        # for it (record_etag), for conditional GETs on later runs
+        self.etags = {}
         # Create our HTTP session with built-in retry logic
         self.session = self._create_session()
+        # Token requests get their own session with a much shorter retry
+        # policy - see _create_auth_session
+        self._auth_session = self._create_auth_session()
     
     def _create_session(self):
         """Create a requests session with retry logic.
@@ -72,21 +111,72 @@ class IBMVerifyClient:
         """
         # Create a new session object - this will persist connections
         session = requests.Session()
+        # Headers every request shares, set once instead of per call.
+        # requests already sends 'Connection: keep-alive' by default
+        session.headers.update({
+            'Accept': 'application/json',  # We expect JSON responses
+            # Compressed JSON is a fraction of the size on the wire. urllib3
+            # lists every encoding it can decode here, which includes br
+            # when the optional brotli package is installed
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+        })
         # Configure our retry strategy with exponential backoff
         retry_strategy = Retry(
             total=self.config.MAX_RETRIES,  # Maximum number of retry attempts
             backoff_factor=self.config.RETRY_BACKOFF,  # Exponential multiplier
-            status_forcelist=[429, 500, 502, 503, 504],  # HTTP codes worth retrying
-            allowed_methods=["GET", "POST"]  # Only retry idempotent operations
+            status_forcelist=RETRY_STATUSES,  # HTTP codes worth retrying
+            allowed_methods=frozenset({"GET"}),  # Only retry idempotent operations
+            # When a 429/503 says how long to wait, wait exactly that long
+            # instead of guessing with backoff. This is urllib3's default,
+            # spelled out because throttling behaviour hinges on it
+            respect_retry_after_header=True
         )
         # Create an adapter with our retry strategy attached
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # The default pool keeps only 10 connections per host, which the
+        # parallel detail fetchers exhaust - connections beyond that get
+        # thrown away after each request and every new one pays a fresh
+        # TCP + TLS handshake. Size the pool to keep them all alive: each
+        # detail worker can have up to three requests in flight at once.
+        # Blocking on a full pool also caps how many requests hit the API at
+        # once - with fetch_all.py running every fetcher side by side, extra
+        # requests wait for a free connection instead of piling onto the
+        # server (and into 429 retries) over throwaway connections
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,  # Distinct hosts to keep pools for
+            pool_maxsize=max(64, 3 * self.config.MAX_WORKERS),  # Keep-alive connections per host
+            pool_block=True  # Wait for a pooled connection rather than open an extra one
+        )
         # Mount the adapter for both HTTP and HTTPS requests
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         # Return our battle-hardened session
         return session
     
+    def _create_auth_session(self):
+        """Create the requests session used for the token endpoint.
+        
+        Token requests happen once per run (or less, with the token cache),
+        so they don't need the data session's big pool or its patient
+        backoff. A couple of quick retries on server errors is plenty - and
+        a rejected credential (400/401) fails on the first attempt instead
+        of after a full round of backoff.
+        
+        Returns:
+            requests.Session: A session with a short retry policy.
+        """
+        session = requests.Session()
+        retry_strategy = Retry(
+            total=2,  # Two quick retries, then give up
+            backoff_factor=0.2,  # Short pauses - this is on the startup path
+            status_forcelist=AUTH_RETRY_STATUSES,  # Transient server errors only
+            allowed_methods=frozenset({"POST"})  # The token exchange is a POST
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def _get_access_token(self):
         """Obtain OAuth2 access token.
         
@@ -95,6 +185,10 @@ class IBMVerifyClient:
         a 60-second buffer before expiration because cutting it close leads
         to authentication errors at the worst possible moments.
         
+        Once a token is 80% of the way through its life, one caller renews
+        it while everyone else carries on with the current token - so a
+        long parallel fetch never stalls all its workers on an expired one.
+        
         Returns:
             str: A valid OAuth2 access token.
             
@@ -102,19 +196,86 @@ class IBMVerifyClient:
             requests.exceptions.RequestException: If token fetch fails.
         """
         # Check if we already have a valid token (reuse is efficient)
-        if self.access_token and time.time() < self.token_expires_at:
+        now = time.time()
+        if self.access_token and now < self.token_expires_at:
+            # Nearly due for renewal? Whoever grabs the lock first renews
+            # early; nobody waits, since the current token still works
+            if now >= self._token_refresh_at and self._token_lock.acquire(blocking=False):
+                try:
+                    self._renew_access_token_early()
+                finally:
+                    self._token_lock.release()
             # Token is still fresh - no need to fetch a new one
             return self.access_token
         
+        # Only one thread refreshes; the rest wait and reuse its token
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self.access_token and time.time() < self.token_expires_at:
+                return self.access_token
+            return self._refresh_access_token()
+    
+    def _renew_access_token_early(self):
+        """Replace a still-valid token that is close to expiring.
+        
+        Callers must hold the token lock - see _get_access_token. Failure
+        isn't fatal here: we keep the current token and try again later.
+        """
+        # Another thread may have renewed it while we were checking
+        if time.time() < self._token_refresh_at:
+            return
+        try:
+            self._refresh_access_token()
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            # Network trouble, or a malformed token response (no
+            # access_token, or a body that isn't JSON) - the current
+            # token still works, so this request shouldn't fail over it
+            logger.warning(f"Early token renewal failed, keeping the current token: {e}")
+            # Give it a rest before the next attempt - halfway to expiry
+            now = time.time()
+            self._token_refresh_at = now + (self.token_expires_at - now) / 2
+    
+    def _refresh_access_token(self):
+        """Fetch a new OAuth2 access token from the token endpoint.
+        
+        Callers must hold the token lock - see _get_access_token.
+        
+        Returns:
+            str: A freshly issued OAuth2 access token.
+            
+        Raises:
+            requests.exceptions.RequestException: If token fetch fails.
+        """
+        # Other script runs share the token cache - the first one to get
+        # here fetches a token and the rest pick it up from disk
+        with self._token_cache_lock():
+            # A previous (or concurrent) run may have left a token that's
+            # still good - but when renewing early, only a newer one than
+            # ours will do
+            newer_than = self.token_expires_at if self.access_token else 0
+            if self._load_cached_token(newer_than):
+                logger.info("Reusing cached access token")
+                return self.access_token
+            return self._request_access_token()
+    
+    def _request_access_token(self):
+        """Exchange our client credentials for a new access token.
+        
+        Returns:
+            str: A freshly issued OAuth2 access token.
+            
+        Raises:
+            requests.exceptions.RequestException: If token fetch fails.
+        """
         # Token is expired or missing - time to get a new one
         logger.info("Obtaining new access token...")
-        logger.debug(f"Token URL: {self.config.token_url}")
-        logger.debug(f"Client ID: {self.config.CLIENT_ID}")
-        logger.debug(f"Tenant: {self.config.TENANT_URL}")
+        logger.debug("Token URL: %s", self.config.token_url)
+        logger.debug("Client ID: %s", self.config.CLIENT_ID)
+        logger.debug("Tenant: %s", self.config.TENANT_URL)
         
         try:
             # Make POST request to token endpoint with credentials
-            response = self.session.post(
+            response = self._auth_session.post(
                 self.config.token_url,
                 data={
                     'grant_type': 'client_credentials',  # OAuth2 grant type
@@ -127,14 +288,15 @@ class IBMVerifyClient:
             # Raise exception for HTTP errors (4xx, 5xx status codes)
             response.raise_for_status()
             
-            # Parse the JSON response containing our new token
-            token_data = response.json()
-            # Extract and store the access token
-            self.access_token = token_data['access_token']
+            # Parse the JSON response containing our new token (orjson on the
+            # raw bytes, same as _make_request)
+            token_data = orjson.loads(response.content)
             # Get token lifetime (default 1 hour if not specified)
             expires_in = token_data.get('expires_in', 3600)
-            # Calculate expiration time with 60-second safety buffer
-            self.token_expires_at = time.time() + expires_in - 60
+            # Store the token, expiring it early with a 60-second safety buffer
+            self._store_access_token(token_data['access_token'], time.time() + expires_in - 60)
+            # Save it so the next script run can skip the token exchange
+            self._save_cached_token()
             
             logger.info("Access token obtained successfully")
             # Return the shiny new token
@@ -145,7 +307,154 @@ class IBMVerifyClient:
             logger.error(f"Failed to obtain access token: {e}")
             raise
     
-    def _make_request(self, url, params=None):
+    def _store_access_token(self, token, expires_at):
+        """Install a new access token on the client and its session.
+        
+        The Authorization header lives on the session, so it's set once per
+        token rather than rebuilt for every request.
+        
+        Args:
+            token (str): The OAuth2 access token.
+            expires_at (float): Unix timestamp after which we stop using it.
+        """
+        self.access_token = token
+        self.token_expires_at = expires_at
+        # Renew early once 80% of the remaining lifetime has passed
+        self._token_refresh_at = expires_at - 0.2 * max(0, expires_at - time.time())
+        self.session.headers['Authorization'] = f'Bearer {token}'  # OAuth2 bearer token
+    
+    def _discard_access_token(self, token):
+        """Forget an access token the server has rejected.
+        
+        A token can stop working before it expires - it was revoked, or the
+        client secret was rotated. Dropping it here, cached copy included,
+        makes the next _get_access_token fetch a new one instead of reusing
+        the dead one (in this run and every later one) until it expires.
+        
+        Args:
+            token (str): The token the server rejected.
+        """
+        with self._token_lock:
+            # Another worker got the same 401 and has already replaced it
+            if self.access_token != token:
+                return
+            self.access_token = None
+            self.token_expires_at = 0
+            cache_file = self._token_cache_file()
+            if cache_file is not None:
+                try:
+                    cache_file.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not remove token cache {cache_file}: {e}")
+    
+    def _token_cache_file(self):
+        """Get the on-disk token cache path for this environment.
+        
+        Returns:
+            Path: Cache file location, or None if token caching is disabled.
+        """
+        if not self.config.TOKEN_CACHE_DIR:
+            return None
+        env_name = self.config.ENV_NAME or 'default'
+        return Path(self.config.TOKEN_CACHE_DIR) / f'token_{env_name}.json'
+    
+    @contextlib.contextmanager
+    def _token_cache_lock(self):
+        """Hold an exclusive lock on the token cache across processes.
+        
+        Does nothing if token caching is disabled or the platform has no
+        fcntl - we just lose the stampede protection, nothing else.
+        """
+        cache_file = self._token_cache_file()
+        if cache_file is None or fcntl is None:
+            yield
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(cache_file.with_suffix('.lock'), 'a')
+        except OSError as e:
+            logger.debug(f"Could not open token cache lock for {cache_file}: {e}")
+            yield
+            return
+        with lock_file:
+            # Blocks while another run is fetching a token
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _load_cached_token(self, newer_than=0):
+        """Load a still-valid access token left by a previous run.
+        
+        The cache is only trusted if it was issued for the same tenant and
+        client ID - a stale file from a different .env shouldn't be reused.
+        Any problem reading it just means we fetch a fresh token.
+        
+        Args:
+            newer_than (float, optional): Only accept a token that expires
+                                          after this Unix timestamp.
+        
+        Returns:
+            bool: True if a valid cached token was loaded.
+        """
+        cache_file = self._token_cache_file()
+        if cache_file is None or not cache_file.exists():
+            return False
+        try:
+            cached = orjson.loads(cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable token cache {cache_file}: {e}")
+            return False
+        # Valid JSON isn't necessarily our format - a hand-edited or
+        # foreign file should mean a fresh token, not a crash
+        if (not isinstance(cached, dict)
+                or not isinstance(cached.get('access_token'), str)
+                or not isinstance(cached.get('expires_at'), (int, float))):
+            logger.debug(f"Ignoring malformed token cache {cache_file}")
+            return False
+        # Make sure this token belongs to the credentials we're using now
+        if (cached.get('tenant_url') != self.config.TENANT_URL
+                or cached.get('client_id') != self.config.CLIENT_ID):
+            return False
+        # Expiry already includes our safety buffer
+        expires_at = cached['expires_at']
+        if time.time() >= expires_at or expires_at <= newer_than:
+            return False
+        self._store_access_token(cached['access_token'], expires_at)
+        return True
+    
+    def _save_cached_token(self):
+        """Persist the current access token for reuse by later runs.
+        
+        The file is created owner-read/write only, since it holds a live
+        bearer token. Failing to write the cache is logged, not raised -
+        it's an optimization, not a requirement.
+        """
+        cache_file = self._token_cache_file()
+        if cache_file is None:
+            return
+        payload = orjson.dumps({
+            'tenant_url': self.config.TENANT_URL,
+            'client_id': self.config.CLIENT_ID,
+            'access_token': self.access_token,
+            'expires_at': self.token_expires_at
+        })
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and swap it in so readers never see a
+            # half-written cache
+            tmp_file = cache_file.with_suffix('.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write token cache {cache_file}: {e}")
+    
+    def _make_request(self, url, params=None, etag=None, accept=None, record_etag=False):
         """Make an authenticated API request.
         
         This is our workhorse method for all API calls. We handle authentication,
@@ -155,39 +464,80 @@ class IBMVerifyClient:
         Args:
             url (str): The full URL to request.
             params (dict, optional): Query parameters to include in the request.
+            etag (str, optional): ETag from an earlier response for this URL.
+                                  Sent as If-None-Match so an unchanged
+                                  resource comes back as an empty 304.
+            accept (str, optional): Media type to ask for instead of the
+                                    session's default application/json.
+            record_etag (bool, optional): Store the response's ETag in
+                                          self.etags under url. Off by
+                                          default so fetchers sharing this
+                                          client don't fill it up.
             
         Returns:
-            dict: Parsed JSON response from the API.
+            dict: Parsed JSON response from the API, or NOT_MODIFIED if the
+                  server says the resource still matches etag.
             
         Raises:
             requests.exceptions.RequestException: If the request fails.
         """
-        # Fetch a valid access token (may reuse cached token)
+        # Make sure the session holds a valid access token (may reuse cached
+        # token) - the Authorization and Accept headers come from the session
         token = self._get_access_token()
-        # Build our request headers with authentication and content type
-        headers = {
-            'Authorization': f'Bearer {token}',  # OAuth2 bearer token
-            'Accept': 'application/json'  # We expect JSON responses
-        }
+        
+        # Per-request headers, only built when something differs from the
+        # session defaults
+        headers = None
+        if accept or etag:
+            headers = {}
+            if accept:
+                headers['Accept'] = accept
+            if etag:
+                # Conditional GET when we've seen this resource before
+                headers['If-None-Match'] = etag
         
         try:
             # Make the GET request with our configured session
             response = self.session.get(
                 url,
-                headers=headers,
                 params=params,  # Query parameters (can be None)
+                headers=headers,
                 timeout=self.config.REQUEST_TIMEOUT
             )
+            # 401 on a token we thought was good means the server has stopped
+            # accepting it. Throw it away and retry once with a fresh one
+            if response.status_code == 401:
+                logger.warning("Access token rejected - requesting a new one")
+                self._discard_access_token(token)
+                self._get_access_token()
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.config.REQUEST_TIMEOUT
+                )
             # Raise an exception if we got an HTTP error status
             response.raise_for_status()
             
-            # Log response details for debugging
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response content-type: {response.headers.get('content-type')}")
-            logger.debug(f"Response body (first 500 chars): {response.text[:500]}")
+            # Unchanged since the caller's copy - there's no body to parse
+            if response.status_code == 304:
+                return NOT_MODIFIED
+            
+            # Remember the ETag so the next run can revalidate instead of
+            # downloading the whole thing again
+            if record_etag and 'ETag' in response.headers:
+                self.etags[url] = response.headers['ETag']
             
-            # Parse and return the JSON response body
-            return response.json()
+            # Log response details for debugging - guarded because building
+            # response.text runs requests' charset detection over the body
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response status: %s", response.status_code)
+                logger.debug("Response content-type: %s", response.headers.get('content-type'))
+                logger.debug("Response body (first 500 chars): %s", response.text[:500])
+            
+            # Parse and return the JSON response body straight from the raw
+            # bytes - orjson is faster and skips the text decoding step
+            return orjson.loads(response.content)
             
         except requests.exceptions.RequestException as e:
             # Request failed - log the error and re-raise
@@ -211,71 +561,109 @@ class IBMVerifyClient:
         Raises:
             requests.exceptions.RequestException: If the request fails.
         """
-        # Fetch a valid access token (may reuse cached token)
-        token = self._get_access_token()
-        # Build our request headers with authentication and SCIM content type
-        headers = {
-            'Authorization': f'Bearer {token}',  # OAuth2 bearer token
-            'Accept': 'application/scim+json'  # SCIM requires this specific content type
-        }
+        # SCIM requires this specific content type - everything else is the
+        # same as a regular request
+        return self._make_request(url, params, accept='application/scim+json')
+    
+    def fetch_pages(self, fetch_page, first_key, remaining_keys):
+        """Fetch a paginated listing, the first page alone and the rest in parallel.
         
-        try:
-            # Make the GET request with our configured session
-            response = self.session.get(
-                url,
-                headers=headers,
-                params=params,  # Query parameters (can be None)
-                timeout=self.config.REQUEST_TIMEOUT
-            )
-            # Raise an exception if we got an HTTP error status
-            response.raise_for_status()
-            
-            # Log response details for debugging
-            logger.debug(f"SCIM Response status: {response.status_code}")
-            logger.debug(f"SCIM Response content-type: {response.headers.get('content-type')}")
-            logger.debug(f"SCIM Response body (first 500 chars): {response.text[:500]}")
+        The first page usually tells us the total, so it has to come first;
+        the remaining pages are then fetched concurrently and handed back in
+        order. Only MAX_WORKERS of them are requested ahead of the caller,
+        so a slow consumer never has the whole listing sitting in memory.
+        Stopping early (break, or closing the generator) cancels whatever
+        hasn't started yet.
+        
+        Args:
+            fetch_page (callable): Fetches one page given its key (offset,
+                start index, ...) and returns the response.
+            first_key: Key of the first page.
+            remaining_keys (callable): Given the first page's response,
+                returns the keys of every other page, in order.
             
-            # Parse and return the JSON response body
-            return response.json()
+        Yields:
+            The response for each page, in key order.
             
-        except requests.exceptions.RequestException as e:
-            # Request failed - log the error and re-raise
-            logger.error(f"SCIM API request failed: {e}")
-            raise
+        Raises:
+            Exception: Whatever fetch_page raised for the failing page.
+        """
+        first_page = fetch_page(first_key)
+        keys = iter(remaining_keys(first_page))
+        with ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
+            # Fill the window before handing back the first page, so the
+            # next pages are already on their way while it's processed
+            in_flight = collections.deque(
+                executor.submit(fetch_page, key)
+                for key in itertools.islice(keys, self.config.MAX_WORKERS)
+            )
+            try:
+                yield first_page
+                while in_flight:
+                    future = in_flight.popleft()
+                    # Top the window back up before waiting on this one
+                    for key in itertools.islice(keys, 1):
+                        in_flight.append(executor.submit(fetch_page, key))
+                    yield future.result()
+            finally:
+                # Caller stopped early or a page failed - don't leave the
+                # executor finishing pages nobody will read
+                for future in in_flight:
+                    future.cancel()
     
     def fetch_applications(self):
         """Fetch all applications with pagination support.
         
-        We paginate through the API results to avoid overwhelming the server
-        or running into memory limits. This generator yields applications one
-        at a time as we fetch them, which is memory-efficient and allows for
-        streaming processing.
+        This generator yields applications one at a time as we fetch them,
+        which is memory-efficient and allows for streaming processing.
+        See fetch_application_pages for how the pages are fetched.
         
         Yields:
             dict: Application data enriched with fetch timestamp metadata.
         """
+        for page in self.fetch_application_pages():
+            yield from page
+    
+    def fetch_application_pages(self):
+        """Fetch all applications a page at a time.
+        
+        We paginate through the API results to avoid overwhelming the server
+        or running into memory limits. The first page tells us the total, so
+        the remaining pages are then fetched in parallel and yielded in order
+        - see fetch_pages. Handing back whole pages lets writers emit a page
+        in one call.
+        
+        Yields:
+            list: One page of application data, each item enriched with
+                fetch timestamp metadata.
+        """
         logger.info("Starting to fetch applications...")
         
-        # Initialize pagination state - we start at the beginning
-        offset = 0
         # Grab page size from config (how many items per request)
-        limit = self.config.DEFAULT_PAGE_SIZE
+        limit = self.config.page_size('applications')
         # Track total count for logging purposes
         total_fetched = 0
+        # Offset of the page being processed (for error reporting)
+        offset = 0
+        # One timestamp for the whole fetch rather than a clock read per app
+        fetch_timestamp = datetime.now(timezone.utc).isoformat()
         
-        # Loop until we've fetched all pages
-        while True:
-            try:
-                # Build query parameters for this page
-                params = {
-                    'limit': limit,  # How many items to fetch
-                    'offset': offset  # Starting position in result set
-                }
-                
-                logger.info(f"Fetching applications (offset={offset}, limit={limit})...")
-                # Make the API request for this page
-                data = self._make_request(self.config.applications_url, params)
-                
+        def fetch_page(page_offset):
+            # Fetch one page of applications starting at page_offset. Per-page
+            # chatter is DEBUG - the final count is logged at INFO
+            logger.debug("Fetching applications (offset=%d, limit=%d)...", page_offset, limit)
+            return self._make_request(
+                self.config.applications_url,
+                {'limit': limit, 'offset': page_offset}
+            )
+        
+        def remaining_offsets(first_page):
+            # Every other page offset, now that the first page says how far to go
+            return range(limit, first_page.get('total', 0), limit)
+        
+        try:
+            # Walk the pages in order, as they come back
+            for data in self.fetch_pages(fetch_page, offset, remaining_offsets):
                 # Extract applications array from response
                 # The API returns applications under _embedded.applications key (v1.0 structure)
                 embedded = data.get('_embedded', {})
@@ -286,51 +674,67 @@ class IBMVerifyClient:
                     logger.info("No more applications to fetch")
                     break
                 
-                # Process each application in this page
-                for app in applications:
-                    # Extract application ID from the href link
-                    # The API returns ID in _links.self.href like "/appaccess/v1.0/applications/123456"
-                    app_id = None
-                    if '_links' in app and 'self' in app['_links']:
-                        href = app['_links']['self'].get('href', '')
-                        # Extract ID from the URL (last part after final /)
-                        if href:
-                            app_id = href.split('/')[-1]
-                            # Add the ID to the app data for easier access later
-                            app['id'] = app_id
-                    
-                    # Enrich application data with metadata
-                    enriched_app = {
-                        'fetch_timestamp': datetime.now(timezone.utc).isoformat(),  # When we got it
-                        'data': app  # The actual application data
-                    }
-                    # Yield this application (generator pattern)
-                    yield enriched_app
-                    # Increment our running total
-                    total_fetched += 1
-                
-                # Check if there are more pages to fetch
-                total = data.get('total', 0)
-                # If we've fetched everything, we're done
-                if offset + limit >= total:
-                    break
-                
-                # Move to the next page by updating offset
+                # Yield the whole page, with each application enriched
+                yield [self._enrich_application(app, fetch_timestamp) for app in applications]
+                # Increment our running total
+                total_fetched += len(applications)
+                # Any error from here on belongs to the next page
                 offset += limit
                 
-            except Exception as e:
-                # Something went wrong - log it and stop pagination
-                logger.error(f"Error fetching applications at offset {offset}: {e}")
-                break
+        except Exception as e:
+            # Something went wrong - log it and stop pagination
+            logger.error(f"Error fetching applications at offset {offset}: {e}")
         
         # Log final statistics
         logger.info(f"Successfully fetched {total_fetched} applications")
+    
+    def _enrich_application(self, app, fetch_timestamp):
+        """Add the application ID and fetch metadata to a raw application.
+        
+        Args:
+            app (dict): Application object from the list endpoint.
+            fetch_timestamp (str): ISO 8601 timestamp for this fetch.
+            
+        Returns:
+            dict: Application data enriched with fetch timestamp metadata.
+        """
+        # Extract application ID from the href link
+        # The API returns ID in _links.self.href like "/appaccess/v1.0/applications/123456"
+        href = app.get('_links', {}).get('self', {}).get('href')
+        if href:
+            # Add the ID to the app data for easier access later - it's the
+            # last part after the final / (rpartition avoids building a list
+            # of every path segment)
+            app['id'] = href.rpartition('/')[2]
+        
+        # Enrich application data with metadata
+        return {
+            'fetch_timestamp': fetch_timestamp,  # When we got it
+            'data': app  # The actual application data
+        }
+
+
+# Cached so every script run in the same process (e.g. from a driver that
+# calls several mains in turn) shares one client - and with it one
+# connection pool and one access token - per environment
+@functools.lru_cache(maxsize=None)
+def get_client(config):
+    """Get the shared IBMVerifyClient for a configuration.
+    
+    Args:
+        config (Config): Configuration instance (as returned by get_config).
+    
+    Returns:
+        IBMVerifyClient: Client for that configuration. Repeated calls with
+            the same config return the same instance.
+    """
+    return IBMVerifyClient(config)
 
 
 def main(config):
     """Main function to fetch applications and save to JSONL.
     
-    This is our entry point. We validate config, set up output paths,
+    This is our entry point. We set up output paths,
     create our client, and stream application data to a JSONL file.
     Using a generator pattern means we write as we fetch, which is
     memory-efficient even for large datasets.
@@ -339,10 +743,6 @@ def main(config):
         config (Config): Configuration instance with credentials loaded.
     """
     try:
-        # Validate configuration before doing anything else
-        # Better to fail early with clear error than mysteriously later
-        config.validate()
-        
         # Set up output directory path using pathlib (cross-platform paths)
         output_dir = Path(config.OUTPUT_DIR)
         # Create directory if it doesn't exist (exist_ok prevents errors)
@@ -350,17 +750,31 @@ def main(config):
         
         # Build full path to output file
         output_file = output_dir / 'applications.jsonl'
+        # Slim sidecar index - one application ID per line, so the details
+        # script can get the IDs without parsing every full record
+        ids_file = output_dir / 'applications.ids.txt'
         
         # Initialize our API client (handles auth and requests)
-        client = IBMVerifyClient(config)
+        client = get_client(config)
         
         # Fetch and write applications in streaming fashion
-        # We open file in write mode with UTF-8 encoding
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Iterate through applications as they're fetched
-            for application in client.fetch_applications():
-                # Write each application as a JSON line
-                f.write(json.dumps(application) + '\n')
+        # Binary mode - orjson hands us UTF-8 encoded bytes - with a 1 MiB
+        # buffer so records reach the disk in large writes
+        with open(output_file, 'wb', buffering=1 << 20) as f, \
+                open(ids_file, 'w', encoding='utf-8') as ids_f:
+            # Iterate through pages of applications as they're fetched
+            for page in client.fetch_application_pages():
+                # Write the page as JSON lines in one call - orjson appends
+                # the newline itself, so there's no extra bytes concatenation
+                f.writelines(
+                    orjson.dumps(application, option=orjson.OPT_APPEND_NEWLINE)
+                    for application in page
+                )
+                # Record their IDs in the index (if we managed to extract them)
+                ids_f.writelines(
+                    application['data']['id'] + '\n'
+                    for application in page if application['data'].get('id')
+                )
         
         # Success! Log where we saved the data
         logger.info(f"Applications saved to {output_file}")
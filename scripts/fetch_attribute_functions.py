@@ -8,13 +8,15 @@ Outputs data to data/{env}/attribute_functions.jsonl in JSONL format.
 """
 # Standard library imports
 import argparse
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Third-party imports - orjson serializes much faster than stdlib json
+import orjson
+
 # Local imports - leveraging our existing client
-from fetch_applications import IBMVerifyClient
+from fetch_applications import get_client
 from config import get_config
 
 # Configure logging - breadcrumbs for troubleshooting
@@ -46,9 +48,8 @@ def fetch_attribute_functions(client, config):
     total_fetched = 0  # Running count for logging
     
     try:
-        # Build the attribute functions URL
-        # Per IBM Verify API docs: GET /v1.0/attributefunctions
-        url = f"{config.TENANT_URL}/v1.0/attributefunctions"
+        # The attribute functions URL is built once in Config
+        url = config.attribute_functions_url
         
         logger.info("Fetching attribute functions...")
         # Make API request
@@ -72,11 +73,14 @@ def fetch_attribute_functions(client, config):
             logger.info("No attribute functions found")
             return
         
+        # One timestamp for the whole response rather than a clock read per function
+        fetch_timestamp = datetime.now(timezone.utc).isoformat()
+        
         # Process each function
         for func in functions:
             # Enrich with metadata
             enriched_func = {
-                'fetch_timestamp': datetime.now(timezone.utc).isoformat(),  # When fetched
+                'fetch_timestamp': fetch_timestamp,  # When fetched
                 'function_id': func.get('id', func.get('functionId')),  # ID
                 'data': func  # The actual function data
             }
@@ -108,14 +112,14 @@ def save_to_jsonl(data_generator, output_file):
     # Ensure output directory exists (create if needed)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Open file in write mode and save each item as a line
-    with open(output_file, 'w', encoding='utf-8') as f:
+    # Open file in binary write mode (orjson emits bytes) with a 1 MiB
+    # buffer and save each item as a line
+    with open(output_file, 'wb', buffering=1 << 20) as f:
         count = 0
         for item in data_generator:
-            # Write JSON line (compact, no pretty printing)
-            json.dump(item, f)
-            # Add newline to separate records
-            f.write('\n')
+            # Write JSON line (compact, no pretty printing) - orjson appends
+            # the newline that separates records itself
+            f.write(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE))
             count += 1
     
     logger.info(f"Attribute functions saved to {output_file}")
@@ -133,7 +137,7 @@ def main(config):
         config (Config): Configuration instance with environment-specific settings.
     """
     # Create API client instance with our config
-    client = IBMVerifyClient(config)
+    client = get_client(config)
     
     # Determine output file path
     # OUTPUT_DIR from config already includes environment-specific path
@@ -163,10 +167,5 @@ if __name__ == '__main__':
     # Load configuration for specified environment
     config = get_config(args.env)
     
-    # Validate configuration before proceeding
-    if not config.validate():
-        logger.error("Configuration validation failed. Check your environment variables.")
-        exit(1)
-    
     # Run the main function
     main(config)
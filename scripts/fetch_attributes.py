@@ -9,13 +9,15 @@ Outputs data to data/attributes.jsonl in JSONL format.
 """
 # Standard library imports
 import argparse
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Third-party imports - orjson serializes much faster than stdlib json
+import orjson
+
 # Local imports - leveraging our existing client
-from fetch_applications import IBMVerifyClient
+from fetch_applications import get_client
 from config import get_config
 
 # Configure logging - breadcrumbs for troubleshooting
@@ -31,8 +33,26 @@ logger = logging.getLogger(__name__)
 def fetch_attributes(client):
     """Fetch all user attributes with pagination support.
     
-    We paginate through attribute schemas because there could be a lot of them.
     This is a generator that yields attributes one at a time for memory efficiency.
+    See fetch_attribute_pages for how the pages are fetched.
+    
+    Args:
+        client (IBMVerifyClient): Authenticated API client instance.
+        
+    Yields:
+        dict: Attribute data enriched with fetch timestamp and metadata.
+    """
+    for page in fetch_attribute_pages(client):
+        yield from page
+
+
+def fetch_attribute_pages(client):
+    """Fetch all user attributes a page at a time.
+    
+    We paginate through attribute schemas because there could be a lot of them.
+    The first page tells us the total, so the remaining pages are then fetched
+    in parallel and yielded in order (see IBMVerifyClient.fetch_pages) - whole
+    pages, so writers can emit a page in one call.
     The API response structure varies (sometimes 'attributes', sometimes 'schemas'),
     so we check for both like paranoid developers should.
     
@@ -40,31 +60,39 @@ def fetch_attributes(client):
         client (IBMVerifyClient): Authenticated API client instance.
         
     Yields:
-        dict: Attribute data enriched with fetch timestamp and metadata.
+        list: One page of attribute data, each item enriched with fetch
+            timestamp and metadata.
     """
     logger.info("Starting to fetch attributes...")
     
     # Initialize pagination variables
-    offset = 0  # Starting position in result set
-    limit = config.DEFAULT_PAGE_SIZE  # How many to fetch per request
+    limit = client.config.page_size('attributes')  # How many to fetch per request
+    offset = 0  # Offset of the page being processed (for error reporting)
     total_fetched = 0  # Running count for logging
+    # One timestamp for the whole fetch rather than a clock read per attribute
+    fetch_timestamp = datetime.now(timezone.utc).isoformat()
     
-    # Loop until we've fetched all pages
-    while True:
-        try:
-            # Build query parameters for pagination
-            params = {
-                'limit': limit,  # Page size
-                'offset': offset  # Starting position
-            }
-            
-            logger.info(f"Fetching attributes (offset={offset}, limit={limit})...")
-            # Make API request for this page
-            data = client._make_request(config.attributes_url, params)
-            
+    def fetch_page(page_offset):
+        # Fetch one page of attributes starting at page_offset
+        logger.debug("Fetching attributes (offset=%d, limit=%d)...", page_offset, limit)
+        return client._make_request(
+            client.config.attributes_url,
+            {'limit': limit, 'offset': page_offset}
+        )
+    
+    def remaining_offsets(first_page):
+        # Sometimes the API returns a list directly - that's everything in
+        # one shot, so there are no more pages to fetch
+        if isinstance(first_page, list):
+            return ()
+        # Every other page offset, now that we know how far to go
+        return range(limit, first_page.get('total', 0), limit)
+    
+    try:
+        # Walk the pages in order, as they come back
+        for data in client.fetch_pages(fetch_page, offset, remaining_offsets):
             # Extract attributes array - API uses different field names
             # (because consistency is for people who don't like debugging)
-            # Sometimes the API returns a dict with 'attributes' key, sometimes a list directly
             if isinstance(data, list):
                 attributes = data
             else:
@@ -75,35 +103,24 @@ def fetch_attributes(client):
                 logger.info("No more attributes to fetch")
                 break
             
-            # Process each attribute in this page
-            for attribute in attributes:
-                # Enrich with metadata
-                enriched_attr = {
-                    'fetch_timestamp': datetime.now(timezone.utc).isoformat(),  # When fetched
+            # Enrich each attribute in this page with metadata and
+            # yield the page (generator pattern)
+            yield [
+                {
+                    'fetch_timestamp': fetch_timestamp,  # When fetched
                     'attribute_id': attribute.get('id', attribute.get('name')),  # ID or name
                     'data': attribute  # The actual attribute schema
                 }
-                # Yield this attribute (generator pattern)
-                yield enriched_attr
-                # Increment counter
-                total_fetched += 1
-            
-            # Check if there are more pages
-            # If data is a list, we got all results in one shot
-            if isinstance(data, list):
-                break
-            total = data.get('total', 0)
-            # If total is 0 or we've fetched everything, stop
-            if total == 0 or offset + limit >= total:
-                break
-            
-            # Move to next page
+                for attribute in attributes
+            ]
+            # Increment counter
+            total_fetched += len(attributes)
+            # Any error from here on belongs to the next page
             offset += limit
-            
-        except Exception as e:
-            # Error fetching this page - log and stop
-            logger.error(f"Error fetching attributes at offset {offset}: {e}")
-            break
+        
+    except Exception as e:
+        # Error fetching a page - log and stop
+        logger.error(f"Error fetching attributes at offset {offset}: {e}")
     
     # Log final count
     logger.info(f"Successfully fetched {total_fetched} attributes")
@@ -112,7 +129,7 @@ def fetch_attributes(client):
 def main(config):
     """Main function to fetch attributes and save to JSONL.
     
-    We orchestrate the whole process: validate config, create output directory,
+    We orchestrate the whole process: create output directory,
     initialize the client, fetch attributes, and write them to a file.
     Using a generator means we stream data to disk instead of loading
     everything into memory (which would be a bad time with large datasets).
@@ -121,9 +138,6 @@ def main(config):
         config (Config): Configuration instance with credentials loaded.
     """
     try:
-        # Validate configuration (fail fast with clear errors)
-        config.validate()
-        
         # Set up output directory using pathlib
         output_dir = Path(config.OUTPUT_DIR)
         # Create directory if needed (exist_ok prevents errors if already there)
@@ -133,15 +147,20 @@ def main(config):
         output_file = output_dir / 'attributes.jsonl'
         
         # Initialize API client (handles authentication)
-        client = IBMVerifyClient(config)
+        client = get_client(config)
         
         # Fetch and write attributes in streaming fashion
-        # Open file in write mode with UTF-8 encoding
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Iterate through attributes as they're fetched
-            for attribute in fetch_attributes(client):
-                # Write each attribute as a JSON line
-                f.write(json.dumps(attribute) + '\n')
+        # Binary mode - orjson hands us UTF-8 encoded bytes - with a 1 MiB
+        # buffer so records reach the disk in large writes
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            # Iterate through pages of attributes as they're fetched
+            for page in fetch_attribute_pages(client):
+                # Write the page as JSON lines in one call - orjson appends
+                # the newline itself, so there's no extra bytes concatenation
+                f.writelines(
+                    orjson.dumps(attribute, option=orjson.OPT_APPEND_NEWLINE)
+                    for attribute in page
+                )
         
         # Success! Log where we saved the data
         logger.info(f"Attributes saved to {output_file}")
@@ -9,13 +9,15 @@ Outputs data to data/groups.jsonl in JSONL format.
 """
 # Standard library imports
 import argparse
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Third-party imports - orjson serializes much faster than stdlib json
+import orjson
+
 # Local imports - leveraging our existing client
-from fetch_applications import IBMVerifyClient
+from fetch_applications import get_client
 from config import get_config
 
 # Configure logging - breadcrumbs for troubleshooting
@@ -31,9 +33,8 @@ logger = logging.getLogger(__name__)
 def fetch_groups(client, config):
     """Fetch all groups with pagination support.
     
-    We paginate through groups because there could be many of them.
     This is a generator that yields groups one at a time for memory efficiency.
-    The API response structure might vary, so we check for common field names.
+    See fetch_group_pages for how the pages are fetched.
     
     Args:
         client (IBMVerifyClient): Authenticated API client instance.
@@ -42,42 +43,85 @@ def fetch_groups(client, config):
     Yields:
         dict: Group data enriched with fetch timestamp and metadata.
     """
+    for page in fetch_group_pages(client, config):
+        yield from page
+
+
+def fetch_group_pages(client, config):
+    """Fetch all groups a page at a time.
+    
+    We paginate through groups because there could be many of them. The
+    first page tells us the total, so the remaining pages are then fetched
+    in parallel and yielded in order (see IBMVerifyClient.fetch_pages) -
+    whole pages, so writers can emit a page in one call.
+    The API response structure might vary, so we check for common field names.
+    
+    Args:
+        client (IBMVerifyClient): Authenticated API client instance.
+        config (Config): Configuration instance with settings.
+        
+    Yields:
+        list: One page of group data, each item enriched with fetch
+            timestamp and metadata.
+    """
     logger.info("Starting to fetch groups...")
     
     # Initialize pagination variables
     # Groups API v2.0 uses SCIM parameters: startIndex (1-based) and count
     start_index = 1  # SCIM uses 1-based indexing
-    count = config.DEFAULT_PAGE_SIZE  # How many to fetch per request
+    count = config.page_size('groups')  # How many to fetch per request
     total_fetched = 0  # Running count for logging
+    # One timestamp for the whole fetch rather than a clock read per group
+    fetch_timestamp = datetime.now(timezone.utc).isoformat()
     
-    # Loop until we've fetched all pages
-    while True:
-        try:
-            # Build query parameters for SCIM pagination
-            params = {
-                'count': count,  # Page size (SCIM parameter)
-                'startIndex': start_index  # Starting position (SCIM 1-based index)
-            }
-            
-            logger.info(f"Fetching groups (startIndex={start_index}, count={count})...")
-            # Make API request for this page - Groups API uses SCIM format
-            # We need to override the Accept header to use application/scim+json
-            data = client._make_scim_request(config.groups_url, params)
-            
-            # Debug: log what we received
-            logger.debug(f"Data type: {type(data)}")
-            if isinstance(data, dict):
-                logger.debug(f"Data keys: {list(data.keys())}")
-                logger.debug(f"Data content (first 500 chars): {str(data)[:500]}")
-            else:
-                logger.debug(f"Data content (first 500 chars): {str(data)[:500]}")
+    def fetch_page(page_start_index):
+        # Build query parameters for SCIM pagination
+        params = {
+            'count': count,  # Page size (SCIM parameter)
+            'startIndex': page_start_index  # Starting position (SCIM 1-based index)
+        }
+        # Per-page chatter is DEBUG - the final count is logged at INFO
+        logger.debug("Fetching groups (startIndex=%d, count=%d)...", page_start_index, count)
+        # Make API request for this page - Groups API uses SCIM format
+        # We need to override the Accept header to use application/scim+json
+        return client._make_scim_request(config.groups_url, params)
+    
+    def remaining_start_indexes(first_page):
+        # If data is a list, we got all results in one shot; otherwise the
+        # SCIM response uses the totalResults field
+        if isinstance(first_page, list):
+            return ()
+        # Every other page's start index, now that we know how far to go
+        total_results = first_page.get('totalResults', 0)
+        return range(1 + count, total_results + 1, count)
+    
+    # Which key holds the groups - every page of a response uses the
+    # same one, so it's worked out on the first page and reused
+    groups_key = None
+    
+    try:
+        # Walk the pages in order, as they come back
+        for data in client.fetch_pages(fetch_page, start_index, remaining_start_indexes):
+            # Debug: log what we received. str(data) renders the whole
+            # page just to keep 500 chars of it, so only do any of this
+            # when DEBUG output is actually switched on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Data type: %s", type(data))
+                if isinstance(data, dict):
+                    logger.debug("Data keys: %s", list(data.keys()))
+                logger.debug("Data content (first 500 chars): %s", str(data)[:500])
             
             # Extract groups array - API might use different field names
             # Sometimes it's wrapped in an object, sometimes it's a direct list
             if isinstance(data, list):
                 groups = data
             else:
-                groups = data.get('groups', data.get('Groups', data.get('Resources', [])))
+                if groups_key is None:
+                    groups_key = next(
+                        (key for key in ('groups', 'Groups', 'Resources') if key in data),
+                        None
+                    )
+                groups = data.get(groups_key, [])
             
             # Check if we got any results
             if not groups:
@@ -85,37 +129,26 @@ def fetch_groups(client, config):
                 logger.info("No more groups to fetch")
                 break
             
-            # Process each group in this page
-            for group in groups:
-                # Enrich with metadata
-                enriched_group = {
-                    'fetch_timestamp': datetime.now(timezone.utc).isoformat(),  # When fetched
-                    'group_id': group.get('id', group.get('groupId')),  # ID
+            # Enrich each group in this page with metadata and yield
+            # the page (generator pattern)
+            yield [
+                {
+                    'fetch_timestamp': fetch_timestamp,  # When fetched
+                    # SCIM groups carry 'id'; older responses used 'groupId'.
+                    # Checked per group - a page can mix the two
+                    'group_id': group.get('id') or group.get('groupId'),  # ID
                     'data': group  # The actual group data
                 }
-                # Yield this group (generator pattern)
-                yield enriched_group
-                # Increment counter
-                total_fetched += 1
-            
-            # Check if there are more pages
-            # If data is a list, we got all results in one shot
-            if isinstance(data, list):
-                break
-            
-            # SCIM response uses totalResults field
-            total_results = data.get('totalResults', 0)
-            # If totalResults is 0 or we've fetched everything, stop
-            if total_results == 0 or start_index + count - 1 >= total_results:
-                break
-            
-            # Move to next page (SCIM uses 1-based indexing)
+                for group in groups
+            ]
+            # Increment counter
+            total_fetched += len(groups)
+            # Any error from here on belongs to the next page
             start_index += count
-            
-        except Exception as e:
-            # Error fetching this page - log and stop
-            logger.error(f"Error fetching groups at startIndex {start_index}: {e}")
-            break
+        
+    except Exception as e:
+        # Error fetching a page - log and stop
+        logger.error(f"Error fetching groups at startIndex {start_index}: {e}")
     
     # Log final count
     logger.info(f"Successfully fetched {total_fetched} groups")
@@ -124,7 +157,7 @@ def fetch_groups(client, config):
 def main(config):
     """Main function to fetch groups and save to JSONL.
     
-    We orchestrate the whole process: validate config, create output directory,
+    We orchestrate the whole process: create output directory,
     initialize the client, fetch groups, and write them to a file.
     Using a generator means we stream data to disk instead of loading
     everything into memory (which would be a bad time with large datasets).
@@ -133,9 +166,6 @@ def main(config):
         config (Config): Configuration instance with credentials loaded.
     """
     try:
-        # Validate configuration (fail fast with clear errors)
-        config.validate()
-        
         # Set up output directory using pathlib
         output_dir = Path(config.OUTPUT_DIR)
         # Create directory if needed (exist_ok prevents errors if already there)
@@ -145,15 +175,20 @@ def main(config):
         output_file = output_dir / 'groups.jsonl'
         
         # Initialize API client (handles authentication)
-        client = IBMVerifyClient(config)
+        client = get_client(config)
         
         # Fetch and write groups in streaming fashion
-        # Open file in write mode with UTF-8 encoding
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Iterate through groups as they're fetched
-            for group in fetch_groups(client, config):
-                # Write each group as a JSON line
-                f.write(json.dumps(group) + '\n')
+        # Binary mode - orjson hands us UTF-8 encoded bytes - with a 1 MiB
+        # buffer so records reach the disk in large writes
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            # Iterate through pages of groups as they're fetched
+            for page in fetch_group_pages(client, config):
+                # Write the page as JSON lines in one call - orjson appends
+                # the newline itself, so there's no extra bytes concatenation
+                f.writelines(
+                    orjson.dumps(group, option=orjson.OPT_APPEND_NEWLINE)
+                    for group in page
+                )
         
         # Success! Log where we saved the data
         logger.info(f"Groups saved to {output_file}")
@@ -14,13 +14,16 @@ tokens. The data includes configuration information like "TOTP", "SMS",
 """
 # Standard library imports
 import argparse
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Third-party imports - orjson serializes much faster than stdlib json
+import orjson
+
 # Local imports - our battle-tested client
-from fetch_applications import IBMVerifyClient
+from fetch_applications import get_client
 from config import get_config
 
 # Configure logging - because debugging blind is no fun
@@ -32,6 +35,11 @@ logging.basicConfig(
 # Logger instance for this module
 logger = logging.getLogger(__name__)
 
+# Fields that are safe to store (method metadata only)
+# This whitelist approach means we explicitly choose what to keep. A
+# frozenset, so membership checks are hashed and nobody can add to it
+SAFE_MFA_FIELDS = frozenset({'id', 'type', 'method', 'name', 'enabled', 'status', 'protocol'})
+
 
 def sanitize_mfa_data(data):
     """Remove any potentially sensitive fields from MFA data.
@@ -47,110 +55,168 @@ def sanitize_mfa_data(data):
     Returns:
         dict: Sanitized MFA data containing only safe metadata fields.
     """
-    # Fields that are safe to store (method metadata only)
-    # This whitelist approach means we explicitly choose what to keep
-    safe_fields = ['id', 'type', 'method', 'name', 'enabled', 'status', 'protocol']
-    
     # Only process if we got a dictionary
     if not isinstance(data, dict):
         return {}
     
-    # Build sanitized dictionary with only safe fields
-    return {key: data[key] for key in safe_fields if key in data}
+    # Build sanitized dictionary with only safe fields. Walking the record
+    # (not the set) keeps the API's field order, so output is the same
+    # from run to run whatever the string hash seed
+    return {key: value for key, value in data.items() if key in SAFE_MFA_FIELDS}
+
+
+def fetch_mfa_method(client, method, fetch_timestamp):
+    """Fetch the detailed configuration for one MFA method.
+    
+    If the detail request fails we fall back to the basic data from the
+    list page - partial data is better than no data. Either way, everything
+    goes through sanitize_mfa_data before it leaves here. And since only
+    SAFE_MFA_FIELDS survive that, a list entry that already has all of them
+    is used as is - the detail request couldn't add anything we'd keep.
+    
+    Args:
+        client (IBMVerifyClient): Authenticated API client instance.
+        method (dict): The method's entry from the authenticators list.
+        fetch_timestamp (str): ISO timestamp to stamp on the record.
+        
+    Returns:
+        dict: Sanitized MFA configuration data with metadata.
+    """
+    method_id = method['id']
+    if SAFE_MFA_FIELDS <= method.keys():
+        # Everything we'd keep is already here - skip the round-trip
+        data = method
+    else:
+        try:
+            # Build detail URL for this specific method
+            detail_url = f"{client.config.mfa_url}/{method_id}"
+            # Fetch the full configuration
+            data = client._make_request(detail_url)
+        except Exception as e:
+            # Detail fetch failed - log error type only (not full details)
+            # We're careful not to log potentially sensitive info
+            logger.warning(f"Could not fetch details for MFA method {method_id}: {type(e).__name__}")
+            # Still return basic data (sanitized, method type/name only)
+            data = method
+    
+    # Sanitize data to remove any potential secrets
+    # We're extra cautious with MFA data
+    return {
+        'fetch_timestamp': fetch_timestamp,  # When
+        'method_id': method_id,  # Which method
+        'data': sanitize_mfa_data(data)  # Sanitized data
+    }
 
 
 def fetch_mfa_configurations(client):
     """Fetch all MFA configurations with pagination support.
     
+    This is a generator that yields configurations one at a time.
+    See fetch_mfa_configuration_pages for how the pages are fetched.
+    
+    Args:
+        client (IBMVerifyClient): Authenticated API client instance.
+        
+    Yields:
+        dict: Sanitized MFA configuration data with metadata.
+    """
+    for page in fetch_mfa_configuration_pages(client):
+        yield from page
+
+
+def fetch_mfa_configuration_pages(client):
+    """Fetch all MFA configurations a page at a time.
+    
     We paginate through MFA methods and sanitize all data before yielding.
     For each method, we try to fetch detailed config, but if that fails we
     still return the basic sanitized data. Every piece of data gets run
     through our sanitization filter - trust no one, sanitize everything.
+    The detail requests for a page run in parallel and are yielded in
+    page order, while the next page's list request is already in flight.
+    Whole pages are yielded, so writers can emit a page in one call.
     
     Args:
         client (IBMVerifyClient): Authenticated API client instance.
         
     Yields:
-        dict: Sanitized MFA configuration data with metadata.
+        list: One page of sanitized MFA configuration data with metadata.
     """
     logger.info("Starting to fetch MFA configurations...")
     
     # Initialize pagination variables
     offset = 0  # Starting position
-    limit = config.DEFAULT_PAGE_SIZE  # Items per request
+    limit = client.config.page_size('mfa')  # Items per request
     total_fetched = 0  # Running count
+    # One timestamp for the whole fetch rather than a clock read per method
+    fetch_timestamp = datetime.now(timezone.utc).isoformat()
     
-    # Paginate through all MFA methods
-    while True:
-        try:
-            # Build pagination parameters
-            params = {
-                'limit': limit,  # Page size
-                'offset': offset  # Start position
-            }
-            
-            logger.info(f"Fetching MFA configs (offset={offset}, limit={limit})...")
-            # Fetch this page of MFA authenticators
-            data = client._make_request(config.mfa_url, params)
-            
-            # The v1.0/authenticators endpoint uses 'authenticators' key
-            mfa_methods = data.get('authenticators', [])
-            # Check if we got any results
-            if not mfa_methods:
-                # No more methods - we're done
-                logger.info("No more MFA configurations to fetch")
-                break
-            
-            # Process each MFA method in this page
-            for method in mfa_methods:
-                # Fetch detailed configuration for each method
-                method_id = method.get('id')
-                # Only proceed if we have an ID
-                if method_id:
-                    try:
-                        # Build detail URL for this specific method
-                        detail_url = f"{config.mfa_url}/{method_id}"
-                        # Fetch the full configuration
-                        detail_data = client._make_request(detail_url)
-                        
-                        # Sanitize data to remove any potential secrets
-                        # We're extra cautious with MFA data
-                        enriched_method = {
-                            'fetch_timestamp': datetime.now(timezone.utc).isoformat(),  # When
-                            'method_id': method_id,  # Which method
-                            'data': sanitize_mfa_data(detail_data)  # Sanitized data
-                        }
-                        # Yield this method (generator pattern)
-                        yield enriched_method
-                        # Increment counter
-                        total_fetched += 1
-                    except Exception as e:
-                        # Detail fetch failed - log error type only (not full details)
-                        # We're careful not to log potentially sensitive info
-                        logger.warning(f"Could not fetch details for MFA method {method_id}: {type(e).__name__}")
-                        # Still yield basic data (sanitized, method type/name only)
-                        # Partial data is better than no data
-                        enriched_method = {
-                            'fetch_timestamp': datetime.now(timezone.utc).isoformat(),
-                            'method_id': method_id,
-                            'data': sanitize_mfa_data(method)  # Fallback to basic data
-                        }
-                        yield enriched_method
-                        total_fetched += 1
-            
-            # Check if there are more pages
-            total = data.get('total', 0)
-            # Stop if we've fetched everything
-            if total == 0 or offset + limit >= total:
+    def fetch_page(page_offset):
+        # Build pagination parameters
+        params = {
+            'limit': limit,  # Page size
+            'offset': page_offset  # Start position
+        }
+        # Per-page chatter is DEBUG - the final count is logged at INFO
+        logger.debug("Fetching MFA configs (offset=%d, limit=%d)...", page_offset, limit)
+        # Fetch this page of MFA authenticators
+        return client._make_request(client.config.mfa_url, params)
+    
+    # One pool for the whole run, so threads are reused across pages, plus
+    # a single thread that keeps the next list page in flight - separate,
+    # so it never queues behind a page's worth of detail requests
+    with ThreadPoolExecutor(max_workers=client.config.MAX_WORKERS) as executor, \
+            ThreadPoolExecutor(max_workers=1) as prefetcher:
+        next_page = prefetcher.submit(fetch_page, offset)
+        # Paginate through all MFA methods
+        while True:
+            try:
+                data = next_page.result()
+                
+                # The v1.0/authenticators endpoint uses 'authenticators' key
+                mfa_methods = data.get('authenticators', [])
+                # Check if we got any results
+                if not mfa_methods:
+                    # No more methods - we're done
+                    logger.info("No more MFA configurations to fetch")
+                    break
+                
+                # Check if there are more pages, and if so start fetching
+                # the next one before working through this one. The server
+                # may cap pages below the limit we asked for, so the next
+                # offset follows what actually came back, and when there's
+                # a total only reaching it ends the run. Responses without a
+                # total keep going until a short (or empty) page
+                total = data.get('total', 0)
+                next_offset = offset + len(mfa_methods)
+                if total:
+                    more_pages = next_offset < total
+                else:
+                    more_pages = len(mfa_methods) >= limit
+                if more_pages:
+                    next_page = prefetcher.submit(fetch_page, next_offset)
+                
+                # Fetch detailed configuration for each method with an ID,
+                # all at once; map hands them back in page order
+                page = list(executor.map(
+                    lambda method: fetch_mfa_method(client, method, fetch_timestamp),
+                    [method for method in mfa_methods if method.get('id')]
+                ))
+                # Yield this page (generator pattern)
+                yield page
+                # Increment counter - only ever on this thread
+                total_fetched += len(page)
+                
+                # Stop if we've fetched everything
+                if not more_pages:
+                    break
+                
+                # Move to next page
+                offset = next_offset
+                
+            except Exception as e:
+                # Page fetch failed - log and stop
+                logger.error(f"Error fetching MFA configurations at offset {offset}: {e}")
                 break
-            
-            # Move to next page
-            offset += limit
-            
-        except Exception as e:
-            # Page fetch failed - log and stop
-            logger.error(f"Error fetching MFA configurations at offset {offset}: {e}")
-            break
     
     # Log final statistics
     logger.info(f"Successfully fetched {total_fetched} MFA configurations")
@@ -160,7 +226,7 @@ def main(config):
     """Main function to fetch MFA configurations and save to JSONL.
     
     Our standard orchestration pattern, but with extra paranoia because
-    we're dealing with MFA configs. We validate, initialize, fetch, and
+    we're dealing with MFA configs. We initialize, fetch, and
     write - all while keeping security front of mind. All data gets
     sanitized before it hits the disk.
     
@@ -168,9 +234,6 @@ def main(config):
         config (Config): Configuration instance with credentials loaded.
     """
     try:
-        # Validate configuration (always the first step)
-        config.validate()
-        
         # Set up output directory
         output_dir = Path(config.OUTPUT_DIR)
         # Create if needed (no error if already exists)
@@ -180,16 +243,21 @@ def main(config):
         output_file = output_dir / 'mfa_configurations.jsonl'
         
         # Initialize API client
-        client = IBMVerifyClient(config)
+        client = get_client(config)
         
         # Fetch and write MFA configurations
         # Important: Only method types and metadata are stored, not actual secrets
-        # We sanitize everything before writing to disk
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Stream MFA configs to file as we fetch them
-            for mfa_config in fetch_mfa_configurations(client):
-                # Write each config as a JSON line
-                f.write(json.dumps(mfa_config) + '\n')
+        # We sanitize everything before writing to disk. A 1 MiB buffer
+        # means records reach the disk in large writes, not one per method
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            # Stream pages of MFA configs to file as we fetch them
+            for page in fetch_mfa_configuration_pages(client):
+                # Write the page as JSON lines in one call - orjson appends
+                # the newline itself, so there's no extra bytes concatenation
+                f.writelines(
+                    orjson.dumps(mfa_config, option=orjson.OPT_APPEND_NEWLINE)
+                    for mfa_config in page
+                )
         
         # Success! Log where we saved the sanitized data
         logger.info(f"MFA configurations saved to {output_file}")
@@ -9,17 +9,17 @@ Outputs data to data/{env}/scim_capabilities.jsonl in JSONL format.
 """
 # Standard library imports
 import argparse
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
 # Third-party imports
+import orjson
 import requests
 
 # Local imports
-from fetch_applications import IBMVerifyClient
-from config import Config
+from fetch_applications import get_client
+from config import get_config
 
 # Configure logging
 logging.basicConfig(
@@ -45,23 +45,11 @@ def fetch_scim_capabilities(client, config):
     """
     logger.info("Fetching SCIM capabilities...")
     
-    # SCIM capabilities endpoint requires SCIM headers
-    headers = {
-        'Authorization': f'Bearer {client._get_access_token()}',
-        'Accept': 'application/scim+json',
-        'Content-Type': 'application/scim+json'
-    }
-    
-    # Construct the capabilities URL
-    capabilities_url = f"{config.TENANT_URL}/v2.0/SCIM/capabilities"
-    
     try:
-        # Make API request for capabilities
-        response = requests.get(capabilities_url, headers=headers, timeout=config.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        # Parse response
-        capabilities = response.json()
+        # Make API request for capabilities - goes through the client's
+        # pooled session (keep-alive, retries, cached token) with the SCIM
+        # Accept header the endpoint requires
+        capabilities = client._make_scim_request(config.scim_capabilities_url)
         
         # Enrich with metadata
         enriched_capabilities = {
@@ -86,33 +74,22 @@ def save_to_jsonl(data, output_file):
         data (dict): Dictionary to save.
         output_file (Path): Path object for output file.
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(output_file, 'wb') as f:
         # Write as a single JSON line
-        f.write(json.dumps(data) + '\n')
+        f.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
     logger.info(f"Saved SCIM capabilities to {output_file}")
 
 
-def main():
-    """Main execution function."""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(
-        description='Fetch SCIM capabilities from IBM Security Verify'
-    )
-    parser.add_argument(
-        '--env',
-        required=True,
-        help='Environment name (e.g., bidevt, wiprt, biqat)'
-    )
-    args = parser.parse_args()
-    
-    logger.info(f"Fetching SCIM capabilities from {args.env}...")
+def main(config):
+    """Main execution function.
     
-    # Initialize configuration for specified environment
-    config = Config(args.env)
-    config.validate()
+    Args:
+        config (Config): Configuration instance with credentials loaded.
+    """
+    logger.info(f"Fetching SCIM capabilities from {config.ENV_NAME}...")
     
     # Initialize API client
-    client = IBMVerifyClient(config)
+    client = get_client(config)
     
     # Prepare output directory
     output_dir = Path(config.OUTPUT_DIR)
@@ -125,8 +102,22 @@ def main():
     # Save to file
     save_to_jsonl(capabilities, output_file)
     
-    logger.info(f"Successfully fetched SCIM capabilities from {args.env}")
+    logger.info(f"Successfully fetched SCIM capabilities from {config.ENV_NAME}")
 
 
 if __name__ == "__main__":
-    main()
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        description='Fetch SCIM capabilities from IBM Security Verify'
+    )
+    parser.add_argument(
+        '--env',
+        required=True,
+        help='Environment name (e.g., bidevt, wiprt, biqat)'
+    )
+    args = parser.parse_args()
+    
+    # Initialize configuration for specified environment
+    config = get_config(args.env)
+    
+    main(config)